@@ -0,0 +1,108 @@
+"""On-disk cache of rendered exports, addressed by content.
+
+A PDF or DOCX is stored under the SHA-256 of everything that goes into
+it: the export kind, the template, and the bin and customer fields in
+canonical JSON.  Saving the same bin again, or printing right after
+saving, copies or streams the stored file instead of rendering it anew.
+Row order is part of the key because it is the physical order of the
+bin; each row's values are already in display order in the layout.
+
+Entries are evicted least recently used first once the directory grows
+past its size limit.  A hit refreshes the file's mtime, which is the
+recency the eviction goes by.
+
+Settings come from the environment:
+    BOLT_BIN_EXPORT_CACHE     cache directory (default ~/.cache/bolt_bin/exports)
+    BOLT_BIN_EXPORT_CACHE_MB  size limit in megabytes (default 64)
+"""
+import hashlib
+import json
+import os
+
+from bin_log import get_logger
+
+log = get_logger('cache')
+
+CACHE_DIR = os.environ.get('BOLT_BIN_EXPORT_CACHE') or os.path.join(
+    os.path.expanduser('~'), '.cache', 'bolt_bin', 'exports')
+MAX_BYTES = int(os.environ.get('BOLT_BIN_EXPORT_CACHE_MB', '64')) * 1024 * 1024
+
+
+def export_key(kind, *parts):
+    """Hex digest of kind and parts as canonical JSON; tuples hash like lists."""
+    canonical = json.dumps([kind, *parts], separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ExportCache:
+    def __init__(self, directory=CACHE_DIR, max_bytes=MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def path(self, key, suffix):
+        return os.path.join(self.directory, key + suffix)
+
+    def get(self, key, suffix):
+        """Path of the cached artifact, or None on a miss."""
+        path = self.path(key, suffix)
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            return None
+        return path
+
+    def fetch(self, key, suffix, build):
+        """Path of the artifact for key, calling build(path) to write it on a miss."""
+        path = self.get(key, suffix)
+        if path is not None:
+            log.debug("Export cache hit %s%s", key, suffix)
+            return path
+        return self._store(key, suffix, build)
+
+    def put(self, key, suffix, data):
+        """Store already rendered bytes under key; returns the path."""
+        def write(path):
+            with open(path, 'wb') as f:
+                f.write(data)
+        return self._store(key, suffix, write)
+
+    def _store(self, key, suffix, build):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(key, suffix)
+        # Written under a temporary name so a crash never leaves half a file under the key
+        partial = f"{path}.{os.getpid()}.tmp"
+        try:
+            build(partial)
+            os.replace(partial, path)
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+        self.evict(keep=path)
+        return path
+
+    def evict(self, keep=None):
+        """Remove least recently used artifacts until the cache fits max_bytes."""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.is_file() or entry.name.endswith('.tmp'):
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        entries.sort()
+        for mtime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue  # Evicted by another app sharing the directory
+            total -= size
+            log.debug("Evicted %s from the export cache", os.path.basename(path))
+
+
+export_cache = ExportCache()
@@ -0,0 +1,19 @@
+# Bolt catalogue shared by the Kivy app and the headless layout engine.
+# Kept free of GUI imports so it can be loaded without Kivy or Tk.
+
+# Configuration class to organize hardcoded data
+class Config:
+    DIAMETERS = ["1/4", "5/16", "3/8", "7/16", "1/2", "5/8", "3/4", "7/8", "1"]
+    MATERIALS = ["Grade 5 Zinc", "Grade 5 Plain", "Grade 8 Yellow Zinc", "Grade 8 Plain", "Stainless Steel"]
+    AVAILABLE_LENGTHS = {
+        "1/4": ["3/8", "1/2", "3/4", "1", "1-1/4", "1-1/2", "2", "2-1/4", "2-1/2", "2-3/4", "3", "3-1/2"],
+        "5/16": ["1/2", "3/4", "1", "1-1/4", "1-1/2", "2", "2-1/2", "2-3/4", "3", "3-1/4", "3-1/2", "4"],
+        "3/8": ["1/2", "3/4", "1", "1-1/4", "1-1/2", "2", "2-1/2", "3", "3-1/2", "4", "4-1/2", "5"],
+        "7/16": ["3/4", "1", "1-1/4", "1-1/2", "2", "2-1/2", "3", "3-1/2", "4", "4-1/2", "5", "5-1/2"],
+        "1/2": ["1", "1-1/4", "1-1/2", "2", "2-1/2", "3", "4", "4-1/2", "5", "5-1/2", "6", "6-1/2"],
+        "5/8": ["1", "1-1/2", "2", "2-1/2", "3", "4", "5", "5-1/2", "6", "6-1/2", "7", "7-1/2"],
+        "3/4": ["1", "1-1/2", "2", "2-1/2", "3", "4", "5", "6", "6-1/2", "7", "7-1/2", "8"],
+        "7/8": ["1-1/2", "2", "2-1/2", "3", "4", "5", "6", "6-1/2", "7", "7-1/2", "8", "8-1/2"],
+        "1": ["2", "2-1/2", "3", "4", "5", "6", "8", "8-1/2", "9", "9-1/2", "10", "10-1/2"]
+    }
+    ITEM_OPTIONS = ["Nut", "Flatwasher", "Lockwasher", "Nylon Locknut"]
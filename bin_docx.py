@@ -0,0 +1,111 @@
+"""Word export for the Kivy summary, filled into a pre-built template.
+
+The heading, the labelled detail paragraphs and the styled full-width
+table are built with python-docx once per process and kept in memory as
+.docx bytes.  Each save loads a copy of those bytes and fills it in:
+the detail paragraphs get their values, and the table's one prototype
+body row is deep-copied once per bin entry in a single pass, instead of
+python-docx's add_row() re-reading the table grid for every row.
+
+Finished documents go into the export cache like the PDFs.  The cached
+file carries no save time; the copy written to the Desktop gets its
+created and modified dates stamped into docProps/core.xml.
+"""
+import copy
+import datetime
+import functools
+import io
+import re
+import zipfile
+
+from bin_cache import export_cache, export_key
+from bin_imports import lazy_import
+
+# Export libraries, loaded on first save (or preloaded by SummaryScreen)
+docx = lazy_import('docx')
+docx_oxml = lazy_import('docx.oxml')
+docx_ns = lazy_import('docx.oxml.ns')
+
+# Bump when the template or fill changes, so cached documents aren't reused
+RENDER_VERSION = 3
+
+DETAILS = ("Name", "Phone", "Bin Size", "Material")
+
+CORE_PROPERTIES = 'docProps/core.xml'
+_DATES = re.compile(rb'(<dcterms:(created|modified)\b[^>]*>)[^<]*(</dcterms:\2>)')
+
+
+@functools.lru_cache(maxsize=None)
+def template():
+    """The summary document without any customer data, as .docx bytes."""
+    qn = docx_ns.qn
+    OxmlElement = docx_oxml.OxmlElement
+
+    doc = docx.Document()
+    doc.core_properties.title = "Bolt Bin Configuration"
+    doc.add_heading("Bolt Bin Configuration", 0)
+    for label in DETAILS:
+        doc.add_paragraph(f"{label}: ")
+
+    # Header plus one prototype body row; the placeholders give each cell a text run to fill
+    table = doc.add_table(rows=2, cols=2)
+    table.style = 'Table Grid'
+    hdr_cells = table.rows[0].cells
+    hdr_cells[0].text = "Diameter"
+    hdr_cells[1].text = "Items/Lengths"
+    row_cells = table.rows[1].cells
+    row_cells[0].text = "-"
+    row_cells[1].text = "-"
+
+    # Set table width to 100% of page
+    table.autofit = False
+    table_width = OxmlElement('w:tblW')
+    table_width.set(qn('w:w'), '5000')
+    table_width.set(qn('w:type'), 'pct')
+    table._tblPr.append(table_width)
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def build_docx(snapshot, path):
+    """Fill a copy of the template with snapshot and save it to path."""
+    doc = docx.Document(io.BytesIO(template()))
+    doc.core_properties.author = snapshot.name or "Unknown"
+
+    # Paragraph 0 is the heading
+    values = (snapshot.name, snapshot.phone, snapshot.bin_size, snapshot.material)
+    for paragraph, label, value in zip(doc.paragraphs[1:], DETAILS, values):
+        paragraph.runs[0].text = f"{label}: {value}"
+
+    t = docx_ns.qn('w:t')
+    prototype = doc.tables[0].rows[1]._tr
+    for diameter, values in snapshot.entries or (("None", ("N/A",)),):
+        tr = copy.deepcopy(prototype)
+        diameter_text, values_text = tr.iter(t)
+        diameter_text.text = diameter
+        values_text.text = ', '.join(values)
+        prototype.addprevious(tr)
+    prototype.getparent().remove(prototype)
+
+    doc.save(path)
+
+
+def copy_stamped(path, desktop_path, when):
+    """Copy the document at path to desktop_path with created/modified set to when (UTC)."""
+    stamp = when.strftime('%Y-%m-%dT%H:%M:%SZ').encode('ascii')
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(desktop_path, 'w', zipfile.ZIP_DEFLATED) as dst:
+        for item in src.infolist():
+            data = src.read(item)
+            if item.filename == CORE_PROPERTIES:
+                data = _DATES.sub(lambda m: m.group(1) + stamp + m.group(3), data)
+            dst.writestr(item, data)
+
+
+def write_docx(snapshot, desktop_path, progress=None):
+    """Export job: write the summary as a Word document to desktop_path."""
+    path = export_cache.fetch(export_key('docx', RENDER_VERSION, snapshot), '.docx',
+                              lambda path: build_docx(snapshot, path))
+    copy_stamped(path, desktop_path, datetime.datetime.now(datetime.timezone.utc))
+    return desktop_path
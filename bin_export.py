@@ -0,0 +1,81 @@
+"""Background export shared by the Kivy and Tk front ends.
+
+reportlab, python-docx and especially a pdflatex run can take seconds, so
+the apps hand exports to an ExportWorker instead of running them on the
+UI thread.  A job works only from the immutable snapshot taken when Save
+or Print was pressed (an ExportSnapshot, or a BinLayout, which is all
+tuples), so the operator can reset the session and serve the next
+customer while the previous file is still rendering.
+
+Progress messages and the result come back through ``post(callback,
+*args)``, which must run the callback on the UI thread: Clock.schedule_once
+for Kivy, a bin_tk.TkDispatcher for Tk.
+"""
+import queue
+import threading
+from collections import namedtuple
+
+from bin_log import get_logger
+
+log = get_logger('export')
+
+# Customer details and (diameter, values) entries as shown in the reports
+ExportSnapshot = namedtuple('ExportSnapshot', ['name', 'phone', 'bin_size', 'material', 'entries'])
+
+
+class ExportWorker:
+    """Runs export jobs one at a time on a daemon thread.
+
+    Jobs are called as ``job(*args, progress=progress)``; ``progress(message)``
+    may be called from the job to report a step.  Jobs run in submission
+    order, so two saves to the same file never race.
+    """
+
+    def __init__(self, post):
+        self.post = post
+        self.jobs = queue.Queue()
+        self.thread = None
+        self.pending = 0  # Submitted but not yet reported back; UI thread only
+
+    def submit(self, job, *args, on_progress=None, on_done=None, on_error=None):
+        """Queue job(*args); on_done(result) or on_error(exception) follows on the UI thread."""
+        self.pending += 1
+        self.jobs.put((job, args, on_progress, on_done, on_error))
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name='export', daemon=True)
+            self.thread.start()
+
+    @property
+    def busy(self):
+        return self.pending > 0
+
+    def close(self, timeout=None):
+        """Let queued jobs finish, waiting up to timeout seconds; call on exit."""
+        if self.thread is not None:
+            self.jobs.put(None)
+            self.thread.join(timeout)
+            self.thread = None
+
+    def _run(self):
+        while True:
+            task = self.jobs.get()
+            if task is None:
+                return
+            job, args, on_progress, on_done, on_error = task
+
+            def progress(message, on_progress=on_progress):
+                if on_progress is not None:
+                    self.post(on_progress, message)
+
+            try:
+                result = job(*args, progress=progress)
+            except Exception as e:
+                log.exception("Export %s failed", getattr(job, '__name__', job))
+                self.post(self._finish, on_error, e)
+            else:
+                self.post(self._finish, on_done, result)
+
+    def _finish(self, callback, value):
+        self.pending -= 1
+        if callback is not None:
+            callback(value)
@@ -1,9 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, Canvas
 import re
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
 import os
+import bin_pdf
+from bin_imports import preload
+from bin_sizes import format_size, parse_size
 
 # Tooltip class for hover messages
 class Tooltip:
@@ -40,6 +41,9 @@ class BoltBinApp:
         self.bolts = []  # List of (size, [lengths]) tuples
         self.max_lengths = 8  # Max lengths per size
         self.setup_gui()
+        # Load reportlab in the background once the window is up, so the
+        # first save doesn't stall on it
+        self.root.after(1000, preload, bin_pdf.pagesizes, bin_pdf.canvas)
 
     def setup_gui(self):
         # Bin size selection
@@ -91,22 +95,11 @@ class BoltBinApp:
         Tooltip(self.canvas, "Visual preview of your bolt bin (rows = sizes, columns = lengths)")
 
     def parse_fraction(self, text):
-        """Convert fraction like 1-1/2 to decimal."""
+        """Convert fraction like 1-1/2 to an exact Size."""
         text = text.strip()
         if not re.match(r"^\d*[-/\d]*$", text):
             return None
-        try:
-            if "-" in text:
-                whole, frac = text.split("-")
-                num, denom = frac.split("/")
-                return float(whole or 0) + float(num) / float(denom)
-            elif "/" in text:
-                num, denom = text.split("/")
-                return float(num) / float(denom)
-            else:
-                return float(text)
-        except (ValueError, ZeroDivisionError):
-            return None
+        return parse_size(text)
 
     def add_bolt(self):
         size = self.size_entry.get()
@@ -120,7 +113,7 @@ class BoltBinApp:
 
         # Find or create size group
         for bolt in self.bolts:
-            if abs(bolt[0] - size_val) < 0.001:
+            if bolt[0] == size_val:
                 if len(bolt[1]) >= self.max_lengths:
                     messagebox.showerror("Error", f"Cannot add more than {self.max_lengths} lengths for size {size}.")
                     return
@@ -145,18 +138,8 @@ class BoltBinApp:
         messagebox.showinfo("Cleared", "All bolts cleared. Start fresh!")
 
     def format_number(self, num):
-        """Convert decimal to fraction if needed, including common bolt fractions."""
-        if num.is_integer():
-            return str(int(num))
-        whole = int(num)
-        frac = num - whole
-        for denom in range(2, 17):  # Check up to 16 for 5/16, 7/16, 9/16
-            num_frac = round(frac * denom)
-            if abs(frac * denom - num_frac) < 0.001:  # Tighter tolerance
-                if whole == 0:
-                    return f"{num_frac}/{denom}"
-                return f"{whole}-{num_frac}/{denom}"
-        return f"{num:.2f}"  # Fallback to decimal if no fraction matches
+        """Convert a size to fraction text like 1-1/2."""
+        return format_size(num)
 
     def update_output(self):
         self.output.delete(1.0, tk.END)
@@ -209,7 +192,7 @@ class BoltBinApp:
         if not file_path:
             return
 
-        c = canvas.Canvas(file_path, pagesize=letter)
+        c = bin_pdf.canvas.Canvas(file_path, pagesize=bin_pdf.pagesizes.letter)
         c.setFont("Helvetica", 12)
         c.drawString(100, 750, "Bolt Bin Layout - Active Bolt & Screw")
         c.drawString(100, 730, f"Bin Size: {self.bin_size.get()} slots")
@@ -1,23 +1,29 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, Canvas
 import re
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
 import os
-import tempfile
-import platform
-import subprocess
+from bin_layout import bolt_entries, layout_bolts, max_rows_for
+from bin_sizes import format_size, parse_size
+from bin_tk import TkBinGrid, TkExporter, sheet_layout
+import bin_pdf
+from bin_imports import preload
 
 # Main app class
 class BoltBinApp:
     def __init__(self, root):
         self.root = root
-        self.root.title("Bolt Bin Generator - Active Bolt & Screw")
+        self.title = "Bolt Bin Generator - Active Bolt & Screw"
+        self.root.title(self.title)
         self.bolts = []  # List of (size, lengths, items) tuples
         self.max_lengths = 4  # Max lengths per size (used for grid display)
         self.max_items = 4    # Max items (Nut, Flatwasher, Lockwasher, Locknut, Blank)
         self.root.geometry("600x750")  # Wider and taller window to accommodate larger canvas
+        # Export progress shows in the window title
+        self.exporter = TkExporter(self.root, self.show_status)
         self.setup_gui()
+        # Load reportlab in the background once the window is up, so the
+        # first save or print doesn't stall on it
+        self.root.after(1000, preload, bin_pdf.pagesizes, bin_pdf.canvas)
 
     def setup_gui(self):
         # Center the main frame
@@ -89,6 +95,9 @@ class BoltBinApp:
         tk.Label(main_frame, text="Bin Layout Preview:").grid(row=7, column=0, columnspan=2, pady=10)
         self.canvas = Canvas(main_frame, width=550, height=350, bg="white")  # Increased height for 72-slot bin
         self.canvas.grid(row=8, column=0, columnspan=2, padx=10, pady=10, sticky="ew")
+        # Cells 40x30, centred on the 550x350 canvas
+        self.grid_view = TkBinGrid(self.canvas, 550, 350, cell_width=40, cell_height=30, label_offset=20,
+                                   font=("TkDefaultFont", 11), header_font=("TkDefaultFont", 10))
         main_frame.columnconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
         self.update_grid()  # Draw empty grid on startup
@@ -98,27 +107,15 @@ class BoltBinApp:
         if self.bolts:
             self.bolts = []
             self.output.delete(1.0, tk.END)
-            self.canvas.delete("all")
             messagebox.showinfo("Reset", "Bolts and items cleared due to material or bin size change.")
         self.update_grid()  # Ensure canvas updates after reset
 
     def parse_fraction(self, text):
-        """Convert fraction like 1-1/2 to decimal."""
+        """Convert fraction like 1-1/2 to an exact Size."""
         text = text.strip()
         if not re.match(r"^\d*[-/\d]*$", text):
             return None
-        try:
-            if "-" in text:
-                whole, frac = text.split("-")
-                num, denom = frac.split("/")
-                return float(whole or 0) + float(num) / float(denom)
-            elif "/" in text:
-                num, denom = text.split("/")
-                return float(num) / float(denom)
-            else:
-                return float(text)
-        except (ValueError, ZeroDivisionError):
-            return None
+        return parse_size(text)
 
     def show_item_popup(self, size):
         """Show a pop-up to select items for a new size."""
@@ -169,7 +166,7 @@ class BoltBinApp:
 
         # Check if size exists
         for bolt in self.bolts:
-            if abs(bolt[0] - size_val) < 0.001:
+            if bolt[0] == size_val:
                 # Check if adding a length exceeds the row capacity (items + lengths)
                 row_capacity = self.max_items + self.max_lengths
                 current_slots = len(bolt[2]) + len(bolt[1])
@@ -205,7 +202,7 @@ class BoltBinApp:
 
         # Check if size exists
         for bolt in self.bolts:
-            if abs(bolt[0] - size_val) < 0.001:
+            if bolt[0] == size_val:
                 row_capacity = self.max_items + self.max_lengths
                 if len(bolt[2]) + len(bolt[1]) >= row_capacity:
                     messagebox.showerror("Error", f"Cannot add more items or lengths (including blanks) for size {size}. Row capacity ({row_capacity}) reached.")
@@ -249,88 +246,37 @@ class BoltBinApp:
         """Clear all bolts and items."""
         self.bolts = []
         self.output.delete(1.0, tk.END)
-        self.canvas.delete("all")
         messagebox.showinfo("Cleared", "All bolts and items cleared. Start fresh!")
         self.update_grid()  # Ensure canvas updates after clear
 
     def format_number(self, num):
-        """Convert decimal to fraction if needed."""
-        if num.is_integer():
-            return str(int(num))
-        whole = int(num)
-        frac = num - whole
-        for denom in range(2, 17):
-            num_frac = round(frac * denom)
-            if abs(frac * denom - num_frac) < 0.001:
-                if whole == 0:
-                    return f"{num_frac}/{denom}"
-                return f"{whole}-{num_frac}/{denom}"
-        return f"{num:.2f}"
+        """Convert a size to fraction text like 1-1/2."""
+        return format_size(num)
 
     def update_output(self):
         self.output.delete(1.0, tk.END)
-        for i, (size, lengths, items) in enumerate(self.bolts, 1):
-            size_str = self.format_number(size)
-            items_str = ", ".join(sorted([items for items in items if items != "Blank"] + ["Blank" for _ in items if items == "Blank"]))
-            lengths_str = ", ".join(self.format_number(l) for l in lengths)
-            contents = ", ".join(filter(None, [items_str, lengths_str]))
+        for i, (size_str, values) in enumerate(bolt_entries(self.bolts, self.format_number), 1):
+            contents = ", ".join(values)
             self.output.insert(tk.END, f"Row {i}: {size_str}\" ({contents})\n")
 
     def update_grid(self):
-        self.canvas.delete("all")
         bin_slots = int(self.bin_size.get())
-        max_rows = 7 if bin_slots == 56 else 9  # Maximum rows based on bin size
+        max_rows = max_rows_for(bin_slots)  # Maximum rows based on bin size
         rows = max_rows if not self.bolts else min(len(self.bolts), max_rows)  # Use max_rows for empty grid
-        cols = self.max_items + self.max_lengths  # Up to 4 items + 4 lengths
-        cell_width = 40
-        cell_height = 30
-        # Center the grid: canvas width=550, height=350
-        grid_width = cols * cell_width  # 8 * 40 = 320
-        grid_height = rows * cell_height  # Up to 9 * 30 = 270
-        offset_x = (550 - grid_width) / 2  # (550 - 320) / 2 = 115
-        offset_y = (350 - grid_height) / 2  # For 9 rows: (350 - 270) / 2 = 40
-
-        # Draw grid
-        for i in range(rows + 1):
-            y = offset_y + i * cell_height
-            self.canvas.create_line(offset_x, y, offset_x + cols * cell_width, y, fill="black")
-        for j in range(cols + 1):
-            x = offset_x + j * cell_width
-            self.canvas.create_line(x, offset_y, x, offset_y + rows * cell_height, fill="black")
+        layout = layout_bolts(self.bolts, rows, self.max_items, self.max_lengths, self.format_number)
 
         # Label rows with sizes (only if bolts exist)
-        for i, (size, _, _) in enumerate(self.bolts[:rows], 0):
-            size_str = self.format_number(size)
-            self.canvas.create_text(offset_x - 20, offset_y + i * cell_height + cell_height / 2,
-                                   text=f"{size_str}\"", anchor="e", font=("TkDefaultFont", 11), fill="black")
-
-        # Draw item and length cells
-        for i, (size, lengths, items) in enumerate(self.bolts[:rows], 0):
-            # Items in columns 0 to 3, in order
-            item_list = [item for item in ["Nut", "Flatwasher", "Lockwasher", "Locknut", "Blank"] if item in items]
-            for j, item in enumerate(item_list[:self.max_items]):
-                if item != "Blank":
-                    item_char = {"Nut": "N", "Flatwasher": "F", "Lockwasher": "L", "Locknut": "LN"}[item]
-                    self.canvas.create_text(offset_x + j * cell_width + cell_width / 2,
-                                           offset_y + i * cell_height + cell_height / 2,
-                                           text=item_char, anchor="center", font=("TkDefaultFont", 11), fill="black")
-                # Blank cells are left empty
-            # Lengths start after items
-            start_col = len(item_list)
-            for j, length in enumerate(lengths[:self.max_lengths]):
-                length_str = self.format_number(length)
-                self.canvas.create_text(offset_x + (j + start_col) * cell_width + cell_width / 2,
-                                       offset_y + i * cell_height + cell_height / 2,
-                                       text=length_str, anchor="center", font=("TkDefaultFont", 11), fill="black")
-
-        # Add column headers
+        row_labels = [f"{layout.label(i)}\"" if i < len(self.bolts) else '' for i in range(rows)]
+        # Column headers: item initials, then length slots
         item_labels = ["Nut", "Flatwasher", "Lockwasher", "Locknut"]
-        for j in range(self.max_items):
-            self.canvas.create_text(offset_x + j * cell_width + cell_width / 2,
-                                   offset_y - 10, text=item_labels[j][0], anchor="center", font=("TkDefaultFont", 10))
-        for j in range(self.max_lengths):
-            self.canvas.create_text(offset_x + (j + self.max_items) * cell_width + cell_width / 2,
-                                   offset_y - 10, text=f"Len {j+1}", anchor="center", font=("TkDefaultFont", 10))
+        headers = [item_labels[j][0] for j in range(self.max_items)] + [f"Len {j+1}" for j in range(self.max_lengths)]
+        self.grid_view.update(layout, row_labels, headers, max_rows)
+
+    def pdf_layout(self):
+        return sheet_layout(self.bolts, self.bin_size.get(), self.max_items, self.max_lengths, self.format_number)
+
+    def show_status(self, status=None):
+        self.root.title(f"{self.title} - {status}" if status else self.title)
 
     def save_pdf(self):
         if not self.bolts:
@@ -345,164 +291,20 @@ class BoltBinApp:
         if not file_path:
             return
 
-        c = canvas.Canvas(file_path, pagesize=letter)
-        c.setFont("Helvetica", 12)
-        c.drawString(100, 750, "Bolt Bin Layout - Active Bolt & Screw")
-        c.drawString(100, 730, f"Bin Size: {self.bin_size.get()} slots")
-        c.drawString(100, 710, f"Material: {self.material.get()}")
-
-        # List bolts and items
-        y = 690
-        for i, (size, lengths, items) in enumerate(self.bolts, 1):
-            size_str = self.format_number(size)
-            items_str = ", ".join(sorted([items for items in items if items != "Blank"] + ["Blank" for _ in items if items == "Blank"]))
-            lengths_str = ", ".join(self.format_number(l) for l in lengths)
-            contents = ", ".join(filter(None, [items_str, lengths_str]))
-            text = f"Row {i}: {size_str}\" ({contents})"
-            c.drawString(100, y, text)
-            y -= 20
-            if y < 400:
-                c.showPage()
-                c.setFont("Helvetica", 12)
-                y = 750
-
-        # Draw grid layout
-        c.drawString(100, y, "Bin Layout:")
-        y -= 20
-        bin_slots = int(self.bin_size.get())
-        rows = 7 if bin_slots == 56 else 9
-        cols = self.max_items + self.max_lengths
-        cell_width = 25
-        cell_height = 20
-        offset_x, offset_y = 100, y - 20
-        text_height = 5
-
-        # Draw grid lines
-        for i in range(rows + 1):
-            y_pos = offset_y - i * cell_height
-            c.line(offset_x, y_pos, offset_x + cols * cell_width, y_pos)
-        for j in range(cols + 1):
-            x_pos = offset_x + j * cell_width
-            c.line(x_pos, offset_y, x_pos, offset_y - rows * cell_height)
-
-        # Label rows with sizes
-        c.setFont("Helvetica", 10)
-        for i, (size, _, _) in enumerate(self.bolts[:rows], 0):
-            size_str = self.format_number(size)
-            c.drawString(offset_x - 40, offset_y - i * cell_height - cell_height / 2 - text_height,
-                         f"{size_str}\"")
-
-        # Draw item and length cells
-        for i, (size, lengths, items) in enumerate(self.bolts[:rows], 0):
-            item_list = [item for item in ["Nut", "Flatwasher", "Lockwasher", "Locknut", "Blank"] if item in items]
-            for j, item in enumerate(item_list[:self.max_items]):
-                if item != "Blank":
-                    item_char = {"Nut": "N", "Flatwasher": "F", "Lockwasher": "L", "Locknut": "LN"}[item]
-                    c.drawCentredString(offset_x + j * cell_width + cell_width / 2,
-                                       offset_y - i * cell_height - cell_height / 2 - text_height, item_char)
-                # Blank cells are left empty
-            start_col = len(item_list)
-            for j, length in enumerate(lengths[:self.max_lengths]):
-                length_str = self.format_number(length)
-                c.drawCentredString(offset_x + (j + start_col) * cell_width + cell_width / 2,
-                                   offset_y - i * cell_height - cell_height / 2 - text_height, length_str)
-
-        c.save()
-        messagebox.showinfo("Success", f"Layout saved as PDF: {os.path.basename(file_path)}")
+        self.exporter.submit(bin_pdf.save, self.bin_size.get(), self.material.get(), self.pdf_layout(), file_path,
+                             done=lambda path: f"Layout saved as PDF: {os.path.basename(path)}", failed="Failed to save PDF")
 
     def print_pdf(self):
         if not self.bolts:
             messagebox.showerror("Error", "No bolts or items to print! Add some first.")
             return
 
-        # Create a temporary PDF file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-            file_path = tmp_file.name
-            c = canvas.Canvas(file_path, pagesize=letter)
-            c.setFont("Helvetica", 12)
-            c.drawString(100, 750, "Bolt Bin Layout - Active Bolt & Screw")
-            c.drawString(100, 730, f"Bin Size: {self.bin_size.get()} slots")
-            c.drawString(100, 710, f"Material: {self.material.get()}")
-
-            # List bolts and items
-            y = 690
-            for i, (size, lengths, items) in enumerate(self.bolts, 1):
-                size_str = self.format_number(size)
-                items_str = ", ".join(sorted([items for items in items if items != "Blank"] + ["Blank" for _ in items if items == "Blank"]))
-                lengths_str = ", ".join(self.format_number(l) for l in lengths)
-                contents = ", ".join(filter(None, [items_str, lengths_str]))
-                text = f"Row {i}: {size_str}\" ({contents})"
-                c.drawString(100, y, text)
-                y -= 20
-                if y < 400:
-                    c.showPage()
-                    c.setFont("Helvetica", 12)
-                    y = 750
-
-            # Draw grid layout
-            c.drawString(100, y, "Bin Layout:")
-            y -= 20
-            bin_slots = int(self.bin_size.get())
-            rows = 7 if bin_slots == 56 else 9
-            cols = self.max_items + self.max_lengths
-            cell_width = 25
-            cell_height = 20
-            offset_x, offset_y = 100, y - 20
-            text_height = 5
-
-            # Draw grid lines
-            for i in range(rows + 1):
-                y_pos = offset_y - i * cell_height
-                c.line(offset_x, y_pos, offset_x + cols * cell_width, y_pos)
-            for j in range(cols + 1):
-                x_pos = offset_x + j * cell_width
-                c.line(x_pos, offset_y, x_pos, offset_y - rows * cell_height)
-
-            # Label rows with sizes
-            c.setFont("Helvetica", 10)
-            for i, (size, _, _) in enumerate(self.bolts[:rows], 0):
-                size_str = self.format_number(size)
-                c.drawString(offset_x - 40, offset_y - i * cell_height - cell_height / 2 - text_height,
-                             f"{size_str}\"")
-
-            # Draw item and length cells
-            for i, (size, lengths, items) in enumerate(self.bolts[:rows], 0):
-                item_list = [item for item in ["Nut", "Flatwasher", "Lockwasher", "Locknut", "Blank"] if item in items]
-                for j, item in enumerate(item_list[:self.max_items]):
-                    if item != "Blank":
-                        item_char = {"Nut": "N", "Flatwasher": "F", "Lockwasher": "L", "Locknut": "LN"}[item]
-                        c.drawCentredString(offset_x + j * cell_width + cell_width / 2,
-                                           offset_y - i * cell_height - cell_height / 2 - text_height, item_char)
-                    # Blank cells are left empty
-                start_col = len(item_list)
-                for j, length in enumerate(lengths[:self.max_lengths]):
-                    length_str = self.format_number(length)
-                    c.drawCentredString(offset_x + (j + start_col) * cell_width + cell_width / 2,
-                                       offset_y - i * cell_height - cell_height / 2 - text_height, length_str)
-
-            c.save()
-
-        # Print the PDF
-        try:
-            if platform.system() == "Windows":
-                os.startfile(file_path, "print")
-            elif platform.system() in ("Linux", "Darwin"):
-                subprocess.run(["lp", file_path], check=True)
-            else:
-                messagebox.showerror("Error", f"Printing not supported on {platform.system()}.")
-                os.unlink(file_path)
-                return
-            messagebox.showinfo("Success", "PDF sent to printer.")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to print PDF: {str(e)}")
-        finally:
-            try:
-                os.unlink(file_path)  # Delete the temporary file
-            except Exception:
-                pass
+        self.exporter.submit(bin_pdf.send_to_printer, self.bin_size.get(), self.material.get(), self.pdf_layout(),
+                             done=lambda result: "PDF sent to printer.", failed="Failed to print PDF")
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = BoltBinApp(root)
     root.mainloop()
+    app.exporter.close()
     
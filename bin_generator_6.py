@@ -1,49 +1,41 @@
 import json
+import logging
+import os
 import re
 from kivy.app import App
-from kivy.uix.screenmanager import ScreenManager, Screen
+from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
-from kivy.uix.popup import Popup
-from kivy.uix.scrollview import ScrollView
+from kivy.clock import Clock
+from kivy.factory import Factory
 from kivy.uix.floatlayout import FloatLayout
 from kivy.properties import StringProperty, ListProperty, NumericProperty
 from kivy.metrics import sp
 from kivy.core.window import Window
-from kivy.graphics import Color, Rectangle, Line
-
-# Configuration class to organize hardcoded data
-class Config:
-    DIAMETERS = ["1/4", "5/16", "3/8", "7/16", "1/2", "5/8", "3/4", "7/8", "1"]
-    MATERIALS = ["Grade 5 Zinc", "Grade 5 Plain", "Grade 8 Yellow Zinc", "Grade 8 Plain", "Stainless Steel"]
-    AVAILABLE_LENGTHS = {
-        "1/4": ["3/8", "1/2", "3/4", "1", "1-1/4", "1-1/2", "2", "2-1/4", "2-1/2", "2-3/4", "3", "3-1/2"],
-        "5/16": ["1/2", "3/4", "1", "1-1/4", "1-1/2", "2", "2-1/2", "2-3/4", "3", "3-1/4", "3-1/2", "4"],
-        "3/8": ["1/2", "3/4", "1", "1-1/4", "1-1/2", "2", "2-1/2", "3", "3-1/2", "4", "4-1/2", "5"],
-        "7/16": ["3/4", "1", "1-1/4", "1-1/2", "2", "2-1/2", "3", "3-1/2", "4", "4-1/2", "5", "5-1/2"],
-        "1/2": ["1", "1-1/4", "1-1/2", "2", "2-1/2", "3", "4", "4-1/2", "5", "5-1/2", "6", "6-1/2"],
-        "5/8": ["1", "1-1/2", "2", "2-1/2", "3", "4", "5", "5-1/2", "6", "6-1/2", "7", "7-1/2"],
-        "3/4": ["1", "1-1/2", "2", "2-1/2", "3", "4", "5", "6", "6-1/2", "7", "7-1/2", "8"],
-        "7/8": ["1-1/2", "2", "2-1/2", "3", "4", "5", "6", "6-1/2", "7", "7-1/2", "8", "8-1/2"],
-        "1": ["2", "2-1/2", "3", "4", "5", "6", "8", "8-1/2", "9", "9-1/2", "10", "10-1/2"]
-    }
-    ITEM_OPTIONS = ["Nut", "Flatwasher", "Lockwasher", "Nylon Locknut"]
-
-# Helper function to convert length strings to decimal for sorting
-def convert_to_decimal(length_str):
-    if '-' in length_str:
-        whole, frac = length_str.split('-')
-        whole = int(whole) if whole else 0
-        num, denom = map(int, frac.split('/'))
-        return whole + num / denom
-    elif '/' in length_str:
-        num, denom = map(int, length_str.split('/'))
-        return num / denom
-    else:
-        return float(length_str)
+from kivy.graphics import Color, Rectangle
+
+from bin_catalog import Config
+from bin_layout import cell_vocabulary, layout_bin_data, max_rows_for, relayout_row
+from bin_widgets import BindingLeakCheck, GridTexture, LazyScreenManager, bindings, canvas_group
+from bin_history import BinHistory
+from bin_rows import BITS, BinRow
+from bin_imports import preload
+from bin_log import dump_recent, get_logger
+from bin_perf import perf
+from bin_export import ExportSnapshot, ExportWorker
+import bin_docx
+import bin_latex
+
+log = get_logger('kivy_app')
+
+
+def post_to_ui(callback, *args):
+    # Clock.schedule_once is safe to call from the export thread
+    Clock.schedule_once(lambda dt: callback(*args))
+
 
 # Custom button with better contrast
 class ContrastButton(Button):
@@ -60,7 +52,8 @@ class StartScreen(Screen):
         with self.canvas.before:
             Color(0, 0, 0, 1)
             self.rect = Rectangle(size=Window.size, pos=(0, 0))
-        self.bind(size=self._update_rect, pos=self._update_rect)
+        self._trigger_rect = Clock.create_trigger(self._update_rect)
+        self.bind(size=self._trigger_rect, pos=self._trigger_rect)
         self.layout.add_widget(Label(text='Bolt Bin Wizard', font_size=sp(45), color=(1, 1, 1, 1), size_hint_y=0.2))
         self.name_input = TextInput(hint_text='Name', font_size=sp(45), size_hint=(1, 0.3), multiline=False, input_type='text', foreground_color=(1, 1, 1, 1), background_color=(0, 0, 0, 1))
         self.phone_input = TextInput(hint_text='Phone', font_size=sp(45), size_hint=(1, 0.3), multiline=False, input_type='number', foreground_color=(1, 1, 1, 1), background_color=(0, 0, 0, 1))
@@ -72,13 +65,17 @@ class StartScreen(Screen):
         self.layout.add_widget(next_btn)
         self.add_widget(self.layout)
 
-    def _update_rect(self, instance, value):
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
+    def _update_rect(self, *args):
+        self.rect.pos = self.pos
+        self.rect.size = self.size
 
     def on_enter(self):
         self.name_input.focus = True
 
+    def reset_session(self):
+        self.name_input.text = ''
+        self.phone_input.text = ''
+
     def format_phone_number(self, instance, value):
         digits = re.sub(r'\D', '', value)
         if len(digits) == 10:
@@ -93,11 +90,11 @@ class StartScreen(Screen):
         app.name = self.name_input.text.strip()
         app.phone = self.phone_input.text.strip()
         if not app.name or not re.match(r'^[A-Za-z\s]+$', app.name):
-            popup = Popup(title='Error', content=Label(text='Name must contain only letters and spaces', font_size=sp(40), color=(1, 1, 1, 1)), size_hint=(0.5, 0.5), background_color=(0, 0, 0, 1))
+            popup = Factory.Popup(title='Error', content=Label(text='Name must contain only letters and spaces', font_size=sp(40), color=(1, 1, 1, 1)), size_hint=(0.5, 0.5), background_color=(0, 0, 0, 1))
             popup.open()
             return
         if not app.phone or not re.match(r'^\d{3}-\d{3}-\d{4}$', app.phone):
-            popup = Popup(title='Error', content=Label(text='Phone must be in format 000-000-0000', font_size=sp(40), color=(1, 1, 1, 1)), size_hint=(0.5, 0.5), background_color=(0, 0, 0, 1))
+            popup = Factory.Popup(title='Error', content=Label(text='Phone must be in format 000-000-0000', font_size=sp(40), color=(1, 1, 1, 1)), size_hint=(0.5, 0.5), background_color=(0, 0, 0, 1))
             popup.open()
             return
         self.manager.current = 'bin_size'
@@ -109,7 +106,8 @@ class BinSizeScreen(Screen):
         with self.canvas.before:
             Color(0, 0, 0, 1)
             self.rect = Rectangle(size=Window.size, pos=(0, 0))
-        self.bind(size=self._update_rect, pos=self._update_rect)
+        self._trigger_rect = Clock.create_trigger(self._update_rect)
+        self.bind(size=self._trigger_rect, pos=self._trigger_rect)
         self.layout.add_widget(Label(text='Choose Bin Size', font_size=sp(60), color=(1, 1, 1, 1), size_hint_y=0.2))
         btn_56 = ContrastButton(text='56 Holes', size_hint=(1, 0.35), font_size=sp(120))  # Increased font size
         btn_72 = ContrastButton(text='72 Holes', size_hint=(1, 0.35), font_size=sp(120))  # Increased font size
@@ -121,16 +119,16 @@ class BinSizeScreen(Screen):
         self.layout.add_widget(btn_72)
         self.layout.add_widget(back_btn)
         self.add_widget(self.layout)
-        print(f"BinSizeScreen: btn_56 font_size={btn_56.font_size}, btn_72 font_size={btn_72.font_size}, back_btn font_size={back_btn.font_size}")
+        log.debug("BinSizeScreen: btn_56 font_size=%s, btn_72 font_size=%s, back_btn font_size=%s", btn_56.font_size, btn_72.font_size, back_btn.font_size)
 
-    def _update_rect(self, instance, value):
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
+    def _update_rect(self, *args):
+        self.rect.pos = self.pos
+        self.rect.size = self.size
 
     def select_bin_size(self, size):
         app = App.get_running_app()
         app.bin_size = size
-        app.max_rows = 7 if size == '56' else 9
+        app.max_rows = max_rows_for(size)
         self.manager.current = 'material'
 
     def go_to_start(self, instance):
@@ -143,15 +141,16 @@ class MaterialScreen(Screen):
         with self.canvas.before:
             Color(0, 0, 0, 1)
             self.rect = Rectangle(size=Window.size, pos=(0, 0))
-        self.bind(size=self._update_rect, pos=self._update_rect)
-        self.scroll_view = ScrollView(size_hint=(1, 0.8))
+        self._trigger_rect = Clock.create_trigger(self._update_rect)
+        self.bind(size=self._trigger_rect, pos=self._trigger_rect)
+        self.scroll_view = Factory.ScrollView(size_hint=(1, 0.8))
         self.material_list = BoxLayout(orientation='vertical', size_hint_y=None)
         self.material_list.bind(minimum_height=self.material_list.setter('height'))
         for mat in Config.MATERIALS:
             btn = ContrastButton(text=mat, size_hint=(1, None), height=sp(100), font_size=sp(45))
             btn.bind(on_press=lambda x, m=mat: self.select_material(m))
             self.material_list.add_widget(btn)
-            print(f"MaterialScreen: Button '{mat}' font_size={btn.font_size}, height={btn.height}")
+            log.debug("MaterialScreen: Button '%s' font_size=%s, height=%s", mat, btn.font_size, btn.height)
         self.scroll_view.add_widget(self.material_list)
         self.layout.add_widget(Label(text='Choose Material', font_size=sp(45), color=(1, 1, 1, 1), size_hint_y=0.1))
         self.layout.add_widget(self.scroll_view)
@@ -160,9 +159,9 @@ class MaterialScreen(Screen):
         self.layout.add_widget(back_btn)
         self.add_widget(self.layout)
 
-    def _update_rect(self, instance, value):
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
+    def _update_rect(self, *args):
+        self.rect.pos = self.pos
+        self.rect.size = self.size
 
     def select_material(self, material):
         App.get_running_app().material = material
@@ -171,33 +170,88 @@ class MaterialScreen(Screen):
     def go_to_bin_size(self, instance):
         self.manager.current = 'bin_size'
 
-class BinConfigScreen(Screen):
+class GridScreen(Screen):
+    """A screen that shows the bin grid as a GridTexture on a white backdrop.
+
+    Subclasses call setup_grid() with the widget the grid is drawn on and
+    provide grid_geometry(), the grid's (pos, size) in that widget's canvas.
+    """
+    # Keep the white box on screen when the bin has no rows yet
+    BACKDROP_WHEN_EMPTY = False
+
+    def setup_grid(self, host, prewarm=None):
+        backdrop = canvas_group(host.canvas.before, 'backdrop')
+        backdrop.add(Color(1, 1, 1, 1))
+        self.backdrop_rect = Rectangle(size=(0, 0))
+        backdrop.add(self.backdrop_rect)
+        with host.canvas.after:
+            Color(1, 1, 1, 1)
+            self.grid_rect = Rectangle(size=(0, 0))
+        self.grid_texture = GridTexture(prewarm=prewarm)
+        self.show_grid = False
+        self._trigger_relayout = Clock.create_trigger(self.relayout)
+        bindings.bind(host, size=self._trigger_relayout, pos=self._trigger_relayout)
+
+    def grid_geometry(self):
+        raise NotImplementedError
+
+    def grid_shown(self):
+        return bool(App.get_running_app().bin_data)
+
+    def on_enter(self):
+        self.show_grid = self.grid_shown()
+        self.relayout()
+
+    def relayout(self, *args):
+        # Runs at most once per frame however many size/pos events fired
+        pos, size = self.grid_geometry()
+        self.backdrop_rect.pos = self.grid_rect.pos = pos
+        self.backdrop_rect.size = size if self.show_grid or self.BACKDROP_WHEN_EMPTY else (0, 0)
+        self.grid_rect.size = size if self.show_grid else (0, 0)
+        if self.show_grid and size[0] > 0 and size[1] > 0:
+            self.render_grid()
+        log.debug("%s: relayout pos=%s, size=%s", type(self).__name__, pos, size)
+
+    def render_grid(self):
+        # This screen's own texture, at the grid's size in pixels
+        self.grid_rect.texture = self.grid_texture.render(App.get_running_app().get_layout(), self.grid_rect.size)
+
+class BinConfigScreen(GridScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=sp(20), spacing=sp(10), size_hint=(1, 1))
         with self.canvas.before:
             Color(0, 0, 0, 1)
             self.rect = Rectangle(size=Window.size, pos=(0, 0))
-        self.bind(size=self._update_rect, pos=self._update_rect)
+        self._trigger_rect = Clock.create_trigger(self._update_rect)
+        self.bind(size=self._trigger_rect, pos=self._trigger_rect)
         app = App.get_running_app()
         max_rows = app.max_rows or 7
         self.bin_layout = GridLayout(cols=8, size_hint=(0.9, 0.7), spacing=0, padding=0, pos_hint={'center_x': 0.5, 'center_y': 0.65})
         self.bin_layout.bind(minimum_height=self._set_minimum_height)
+        self.bin_layout.row_force_default = True
         self.layout.add_widget(Label(text='Configure Your Bin', font_size=sp(35), color=(1, 1, 1, 1), size_hint_y=0.1))
         self.layout.add_widget(self.bin_layout)
         self.add_btn = ContrastButton(text='Add Diameter', size_hint=(1, 0.1), font_size=sp(20))
-        self.undo_btn = ContrastButton(text='Undo', size_hint=(1, 0.1), font_size=sp(20))
+        self.undo_btn = ContrastButton(text='Undo', font_size=sp(20))
+        self.redo_btn = ContrastButton(text='Redo', font_size=sp(20))
+        history_layout = BoxLayout(orientation='horizontal', size_hint=(1, 0.1))
+        history_layout.add_widget(self.undo_btn)
+        history_layout.add_widget(self.redo_btn)
         finish_btn = ContrastButton(text='Finish', size_hint=(1, 0.1), font_size=sp(20))
         back_btn = ContrastButton(text='Back', size_hint=(1, 0.1), font_size=sp(20))
         self.add_btn.bind(on_press=self.add_diameter)
         self.undo_btn.bind(on_press=self.undo_last_action)
+        self.redo_btn.bind(on_press=self.redo_last_action)
         finish_btn.bind(on_press=self.go_to_summary)
         back_btn.bind(on_press=self.go_to_material)
         self.layout.add_widget(self.add_btn)
-        self.layout.add_widget(self.undo_btn)
+        self.layout.add_widget(history_layout)
         self.layout.add_widget(finish_btn)
         self.layout.add_widget(back_btn)
         self.add_widget(self.layout)
+        # Fill the cell text cache once the grid's cell width is known
+        self.setup_grid(self.bin_layout, prewarm=cell_vocabulary())
 
     def _set_minimum_height(self, instance, value):
         app = App.get_running_app()
@@ -205,117 +259,64 @@ class BinConfigScreen(Screen):
             app.max_rows = 7
         return self.bin_layout.height
 
-    def _update_rect(self, instance, value):
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
+    def _update_rect(self, *args):
+        self.rect.pos = self.pos
+        self.rect.size = self.size
 
     def on_enter(self):
         app = App.get_running_app()
-        self.bin_layout.clear_widgets()
-        self.bin_layout.canvas.clear()
-
         if not app.max_rows:
             app.max_rows = 7
-
-        max_rows = app.max_rows
-        num_cols = 8
-        layout_width = self.bin_layout.width
-        layout_height = self.bin_layout.height
-        row_height = layout_height / max_rows if max_rows > 0 else sp(50)
-
-        if layout_width <= 0 or layout_height <= 0:
-            print("Warning: Invalid layout dimensions, skipping grid rendering")
+        if self.bin_layout.width <= 0 or self.bin_layout.height <= 0:
+            log.warning("Invalid layout dimensions, skipping grid rendering")
             return
+        super().on_enter()
 
-        self.bin_layout.size = (layout_width, layout_height)
-        self.bin_layout.cols = num_cols
-        self.bin_layout.row_force_default = True
-        self.bin_layout.row_default_height = row_height
-        self.bin_layout.spacing = 0
-        self.bin_layout.padding = 0
-
-        with self.bin_layout.canvas.before:
-            Color(1, 1, 1, 1)
-            self.bin_rect = Rectangle(size=(layout_width, layout_height), pos=self.bin_layout.pos)
-
-        self.bin_layout.bind(size=self._update_bin_rect, pos=self._update_bin_rect)
+    def grid_shown(self):
+        return True  # The empty grid is where the customer starts
 
-        cell_width = layout_width / num_cols
-        cell_height = row_height
+    def refresh_edited_row(self, edit):
+        # Lays out and redraws only the edited row; the rest of the grid
+        # texture is left as it is
+        App.get_running_app().mark_row_changed(edit.position)
+        self.render_grid()
 
-        with self.bin_layout.canvas:
-            Color(0, 0, 0, 1)
-            for i in range(max_rows + 1):
-                Line(points=[self.bin_layout.x, self.bin_layout.y + i * cell_height, self.bin_layout.x + layout_width, self.bin_layout.y + i * cell_height])
-            for i in range(num_cols + 1):
-                Line(points=[self.bin_layout.x + i * cell_width, self.bin_layout.y, self.bin_layout.x + i * cell_width, self.bin_layout.y + layout_height])
-
-        for row in range(max_rows):
-            for col in range(num_cols):
-                if row < len(app.bin_data):
-                    entry = app.bin_data[row]
-                    diameter = entry['diameter']
-                    items = sorted([item for item in entry['items'] if item in Config.ITEM_OPTIONS])
-                    lengths = sorted(entry['lengths'], key=convert_to_decimal)
-                    selected_items = items + lengths
-                    size_text = f"{diameter} x {selected_items[col]}" if col < len(selected_items) else ""
-                else:
-                    size_text = ""
-                item_label = Label(
-                    text=size_text,
-                    size_hint=(None, None),
-                    size=(cell_width, cell_height),
-                    color=(0, 0, 0, 1),
-                    font_size=sp(14),
-                    halign='center',
-                    valign='center',
-                    text_size=(cell_width - sp(4), cell_height - sp(4))
-                )
-                self.bin_layout.add_widget(item_label)
-                print(f"Label at row={row}, col={col}: text='{size_text}', text_size={item_label.text_size}, size={item_label.size}")
-
-    def _update_bin_rect(self, instance, value):
-        app = App.get_running_app()
-        max_rows = app.max_rows or 7
-        layout_width = instance.width
-        layout_height = instance.height
-        layout_x = (self.layout.width - layout_width) / 2
-        layout_y = self.layout.height * 0.65 - layout_height / 2
-        self.bin_rect.pos = (layout_x, layout_y)
-        self.bin_rect.size = (layout_width, layout_height)
-        self.bin_layout.size = (layout_width, layout_height)
-        self.bin_layout.row_default_height = layout_height / max_rows if max_rows > 0 else sp(50)
-        print(f"BinConfigScreen: Updated bin_rect pos=({layout_x}, {layout_y}), size=({layout_width}, {layout_height})")
+    def grid_geometry(self):
+        """(pos, size) of the grid; the GridLayout's own box is the one source."""
+        return tuple(self.bin_layout.pos), tuple(self.bin_layout.size)
 
+    @perf.action('add_diameter')
     def add_diameter(self, instance):
         app = App.get_running_app()
         if len(app.bin_data) >= app.max_rows:
-            popup = Popup(title='Error', content=Label(text=f'Maximum {app.max_rows} diameters reached', font_size=sp(20), color=(1, 1, 1, 1)), size_hint=(0.5, 0.5), background_color=(0, 0, 0, 1))
+            popup = Factory.Popup(title='Error', content=Label(text=f'Maximum {app.max_rows} diameters reached', font_size=sp(20), color=(1, 1, 1, 1)), size_hint=(0.5, 0.5), background_color=(0, 0, 0, 1))
             popup.open()
             return
         self.manager.current = 'add_diameter'
 
+    @perf.action('undo')
     def undo_last_action(self, instance):
         app = App.get_running_app()
-        if not app.action_history:
-            popup = Popup(title='Error', content=Label(text='Nothing to undo', font_size=sp(20), color=(1, 1, 1, 1)), size_hint=(0.5, 0.5), background_color=(0, 0, 0, 1))
+        edit = app.history.undo()  # Revert the most recent confirm as one step
+        if edit is None:
+            popup = Factory.Popup(title='Error', content=Label(text='Nothing to undo', font_size=sp(20), color=(1, 1, 1, 1)), size_hint=(0.5, 0.5), background_color=(0, 0, 0, 1))
+            popup.open()
+            return
+        log.info("Undid %#06x for diameter %s%s", edit.bits, edit.diameter, " (removed row)" if edit.created else "")
+        self.refresh_edited_row(edit)
+
+    @perf.action('redo')
+    def redo_last_action(self, instance):
+        app = App.get_running_app()
+        edit = app.history.redo()
+        if edit is None:
+            popup = Factory.Popup(title='Error', content=Label(text='Nothing to redo', font_size=sp(20), color=(1, 1, 1, 1)), size_hint=(0.5, 0.5), background_color=(0, 0, 0, 1))
             popup.open()
             return
-        diameter, value, action_type = app.action_history.pop()  # Remove the most recent action
-        for entry in app.bin_data:
-            if entry['diameter'] == diameter:
-                if action_type == 'item' and value in entry['items']:
-                    entry['items'].remove(value)
-                    print(f"Undid item {value} for diameter {diameter}")
-                elif action_type == 'length' and value in entry['lengths']:
-                    entry['lengths'].remove(value)
-                    print(f"Undid length {value} for diameter {diameter}")
-                if not entry['items'] and not entry['lengths']:
-                    app.bin_data.remove(entry)
-                    print(f"Removed empty diameter entry {diameter}")
-                break
-        self.on_enter()  # Refresh the grid
+        log.info("Redid %#06x for diameter %s", edit.bits, edit.diameter)
+        self.refresh_edited_row(edit)
 
+    @perf.action('finish')
     def go_to_summary(self, instance):
         self.manager.current = 'summary'
 
@@ -323,111 +324,103 @@ class BinConfigScreen(Screen):
         self.manager.current = 'material'
 
 class AddLengthScreen(Screen):
+    SELECTED_COLOR = (0.1, 0.7, 0.3, 1)
+    UNSELECTED_COLOR = (0.2, 0.6, 0.8, 1)  # ContrastButton's own colour
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=sp(20), spacing=sp(20), size_hint=(1, 1))
         with self.canvas.before:
             Color(0, 0, 0, 1)
             self.rect = Rectangle(size=Window.size, pos=(0, 0))
-        self.bind(size=self._update_rect, pos=self._update_rect)
+        self._trigger_rect = Clock.create_trigger(self._update_rect)
+        self.bind(size=self._trigger_rect, pos=self._trigger_rect)
         self.label = Label(text='', font_size=sp(35), color=(1, 1, 1, 1), size_hint_y=0.1)
-        self.grid = GridLayout(cols=4, rows=4, size_hint_y=0.5, spacing=sp(10), padding=sp(10))
+        self.grid_area = BoxLayout(size_hint_y=0.5)
         self.button_layout = BoxLayout(orientation='horizontal', size_hint_y=0.2)
         self.confirm_btn = ContrastButton(text='Confirm')
         self.back_btn = ContrastButton(text='Back')
+        bindings.bind(self.confirm_btn, on_press=self.confirm_selection)
+        bindings.bind(self.back_btn, on_press=self.go_to_add_diameter)
         self.button_layout.add_widget(self.confirm_btn)
         self.button_layout.add_widget(self.back_btn)
         self.layout.add_widget(self.label)
-        self.layout.add_widget(self.grid)
+        self.layout.add_widget(self.grid_area)
         self.layout.add_widget(self.button_layout)
         self.add_widget(self.layout)
-        self.selected_lengths = set()
-        self.selected_items = set()
-
-    def _update_rect(self, instance, value):
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
-
-    def on_enter(self):
-        app = App.get_running_app()
-        diameter = app.selected_diameter
-        self.label.text = f"Select Lengths and Items for Diameter {diameter}"
+        self.button_sets = {}  # diameter -> (grid, {bit: button}), built on first use
+        self.buttons = {}
+        self.pending_diameter = None
+        self.pending = 0  # BinRow bitmask of the lengths and items toggled on
+
+    def _update_rect(self, *args):
+        self.rect.pos = self.pos
+        self.rect.size = self.size
+
+    def button_set(self, diameter):
+        cached = self.button_sets.get(diameter)
+        if cached is not None:
+            return cached
+        grid = GridLayout(cols=4, rows=4, spacing=sp(10), padding=sp(10))
+        buttons = {}
+        bits = BITS[diameter]
         available_lengths = Config.AVAILABLE_LENGTHS.get(diameter, [])
-        self.grid.clear_widgets()
-        self.length_buttons = {}
-        self.item_buttons = {}
 
         for i in range(12):
             if i < len(available_lengths):
                 length = available_lengths[i]
                 btn = ContrastButton(text=length, size_hint=(1, None), height=sp(60))
-                btn.bind(on_press=lambda x, l=length: self.toggle_selection(x, l, 'length'))
-                self.length_buttons[btn] = length
-                if length in self.selected_lengths:
-                    btn.text = f"{length} [X]"
-                self.grid.add_widget(btn)
+                btn.bind(on_press=lambda x, b=bits[length]: self.toggle_selection(b))
+                buttons[bits[length]] = btn
             else:
                 btn = Button(text='', disabled=True, size_hint=(1, None), height=sp(60))
-                self.grid.add_widget(btn)
+            grid.add_widget(btn)
 
-        for i, item in enumerate(Config.ITEM_OPTIONS):
+        for item in Config.ITEM_OPTIONS:
             btn = ContrastButton(text=item, size_hint=(1, None), height=sp(60))
-            btn.bind(on_press=lambda x, it=item: self.toggle_selection(x, it, 'item'))
-            self.item_buttons[btn] = item
-            if item in self.selected_items:
-                btn.text = f"{item} [X]"
-            self.grid.add_widget(btn)
-
-        self.confirm_btn.bind(on_press=self.confirm_selection)
-        self.back_btn.bind(on_press=self.go_to_add_diameter)
-
-    def toggle_selection(self, instance, value, type_):
-        if type_ == 'length':
-            target_set = self.selected_lengths
-            button_dict = self.length_buttons
-        else:
-            target_set = self.selected_items
-            button_dict = self.item_buttons
-
-        if value in target_set:
-            target_set.remove(value)
-            instance.text = value
-        else:
-            target_set.add(value)
-            instance.text = f"{value} [X]"
+            btn.bind(on_press=lambda x, b=bits[item]: self.toggle_selection(b))
+            buttons[bits[item]] = btn
+            grid.add_widget(btn)
 
+        self.button_sets[diameter] = (grid, buttons)
+        return grid, buttons
+
+    def on_enter(self):
+        app = App.get_running_app()
+        diameter = app.selected_diameter
+        self.label.text = f"Select Lengths and Items for Diameter {diameter}"
+        if diameter != self.pending_diameter:
+            # Toggles made for another diameter don't carry over
+            self.pending_diameter = diameter
+            self.pending = 0
+        grid, self.buttons = self.button_set(diameter)
+        if grid.parent is not self.grid_area:
+            self.grid_area.clear_widgets()
+            self.grid_area.add_widget(grid)
+        for bit, btn in self.buttons.items():
+            btn.background_color = self.SELECTED_COLOR if self.pending & bit else self.UNSELECTED_COLOR
+
+    @perf.action('toggle')
+    def toggle_selection(self, bit):
+        self.pending ^= bit
+        self.buttons[bit].background_color = self.SELECTED_COLOR if self.pending & bit else self.UNSELECTED_COLOR
+
+    @perf.action('confirm')
     def confirm_selection(self, instance):
         app = App.get_running_app()
         diameter = app.selected_diameter
-        for entry in app.bin_data:
-            if entry['diameter'] == diameter:
-                entry['lengths'] = list(set(entry['lengths'] + list(self.selected_lengths)))
-                entry['items'] = list(set(entry['items'] + list(self.selected_items)))
-                # Append each new item/length to action_history
-                for item in self.selected_items:
-                    app.action_history.append((diameter, item, 'item'))
-                    print(f"Added action to history: diameter={diameter}, item={item}, type=item")
-                for length in self.selected_lengths:
-                    app.action_history.append((diameter, length, 'length'))
-                    print(f"Added action to history: diameter={diameter}, length={length}, type=length")
-                break
-        else:
-            app.bin_data.append({
-                'diameter': diameter,
-                'lengths': list(self.selected_lengths),
-                'items': list(self.selected_items)
-            })
-            # Append each new item/length to action_history
-            for item in self.selected_items:
-                app.action_history.append((diameter, item, 'item'))
-                print(f"Added action to history: diameter={diameter}, item={item}, type=item")
-            for length in self.selected_lengths:
-                app.action_history.append((diameter, length, 'length'))
-                print(f"Added action to history: diameter={diameter}, length={length}, type=length")
-        self.selected_lengths.clear()
-        self.selected_items.clear()
+        # Record the whole selection as a single undoable step
+        edit = app.history.apply(diameter, BinRow(diameter, self.pending).values())
+        if edit is not None:
+            log.info("Added action to history: diameter=%s, bits=%#06x, created=%s", diameter, edit.bits, edit.created)
+            app.mark_row_changed(edit.position)
+        self.pending = 0
         self.manager.current = 'bin_config'
 
+    def reset_session(self):
+        self.pending = 0
+        self.pending_diameter = None
+
     def go_to_add_diameter(self, instance):
         self.manager.current = 'add_diameter'
 
@@ -443,28 +436,120 @@ class BoltBinApp(App):
     available_lengths = Config.AVAILABLE_LENGTHS
     item_options = ListProperty(Config.ITEM_OPTIONS)
     selected_diameter = StringProperty('')
-    action_history = ListProperty([])  # Store list of (diameter, value, type) for undo
+    history = None  # BinHistory over bin_data, for undo/redo
+    layout_version = 0  # Bumped whenever bin_data changes in place
+    _layout = None
+    _layout_key = None
+    binding_check = None
+    session_count = 0  # Customer sessions completed since the process started
+    exporter = None  # ExportWorker running saves off the UI thread
+    # Screens usually visited next, built in the background after each one
+    PREWARM = {
+        'start': ['bin_size'],
+        'bin_size': ['material'],
+        'material': ['bin_config'],
+        'bin_config': ['add_diameter', 'summary'],
+        'add_diameter': ['add_length'],
+    }
+
+    def mark_bin_changed(self):
+        self.layout_version += 1
+
+    def mark_row_changed(self, position):
+        # An edit to one row patches the cached layout when it is current
+        # instead of laying out every row again
+        current = self._layout_key == (self.layout_version, self.max_rows)
+        self.mark_bin_changed()
+        if current:
+            self._layout = relayout_row(self._layout, self.bin_data, position)
+            self._layout_key = (self.layout_version, self.max_rows)
+
+    def get_layout(self):
+        # Shared by every grid screen and exporter; rebuilt only after a change
+        key = (self.layout_version, self.max_rows)
+        if self._layout_key != key:
+            self._layout = layout_bin_data(self.bin_data, self.max_rows or 7)
+            self._layout_key = key
+        return self._layout
+
+    def export_snapshot(self):
+        """Immutable copy of the session for an export job."""
+        return ExportSnapshot(
+            name=self.name or "Not specified",
+            phone=self.phone or "Not specified",
+            bin_size=self.bin_size or "Not specified",
+            material=self.material or "Not specified",
+            entries=tuple((diameter, values) for diameter, values in self.get_layout().entries if values),
+        )
+
+    def reset_session(self):
+        # Kiosk mode: Done hands the app to the next customer in-process
+        # instead of exiting and paying Kivy's start-up cost again
+        self.name = ''
+        self.phone = ''
+        self.bin_size = ''
+        self.material = ''
+        self.selected_diameter = ''
+        self.max_rows = 7
+        self.history.clear()  # Empties bin_data in place, plus undo/redo
+        self.mark_bin_changed()
+        for screen in self.root.screens:
+            if hasattr(screen, 'reset_session'):
+                screen.reset_session()
+        self.root.current = 'start'
+        self.session_count += 1
+        log.info("Session %d reset", self.session_count)
+        # The kiosk rarely exits, so report perf figures per session too;
+        # the peak RSS in them should level off, not climb, over thousands
+        # of resets
+        perf.export()
+
+    def on_start(self):
+        perf.start()
+
+    def on_stop(self):
+        perf.export()
+        self.exporter.close(timeout=30)  # Let a save in flight finish writing
+
+    def check_bindings(self, manager, current):
+        # Registered handler counts must not grow from one screen visit to the next
+        for widget, event, before, now in self.binding_check.check():
+            log.warning("Binding leak: %s.%s grew from %d to %d callbacks", type(widget).__name__, event, before, now)
+        if log.isEnabledFor(logging.DEBUG):
+            counts = bindings.counts()
+            log.debug("Entering %s: %d callbacks bound on %d registered widget events", current, sum(counts.values()), len(counts))
 
     def build(self):
         Window.maximize()
-        sm = ScreenManager()
-        sm.add_widget(StartScreen(name='start'))
-        sm.add_widget(BinSizeScreen(name='bin_size'))
-        sm.add_widget(MaterialScreen(name='material'))
-        sm.add_widget(BinConfigScreen(name='bin_config'))
-        sm.add_widget(AddDiameterScreen(name='add_diameter'))
-        sm.add_widget(AddLengthScreen(name='add_length'))
-        sm.add_widget(SummaryScreen(name='summary'))
+        self.history = BinHistory(self.bin_data)
+        self.exporter = ExportWorker(post_to_ui)
+        # Screens are built on first navigation; only StartScreen exists
+        # before the first frame
+        sm = LazyScreenManager({
+            'start': StartScreen,
+            'bin_size': BinSizeScreen,
+            'material': MaterialScreen,
+            'bin_config': BinConfigScreen,
+            'add_diameter': AddDiameterScreen,
+            'add_length': AddLengthScreen,
+            'summary': SummaryScreen,
+        }, prewarm=self.PREWARM)
+        sm.current = 'start'
+        self.binding_check = BindingLeakCheck()
+        sm.bind(current=self.check_bindings)
         return sm
     
-class AddDiameterScreen(Screen):
+class AddDiameterScreen(GridScreen):
+    BACKDROP_WHEN_EMPTY = True
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=sp(20), spacing=sp(20), size_hint=(1, 1))
         with self.canvas.before:
             Color(0, 0, 0, 1)
             self.rect = Rectangle(size=Window.size, pos=(0, 0))
-        self.bind(size=self._update_rect, pos=self._update_rect)
+        self._trigger_rect = Clock.create_trigger(self._update_rect)
+        self.bind(size=self._trigger_rect, pos=self._trigger_rect)
         self.diameter_selection = BoxLayout(orientation='vertical', size_hint_y=0.3)
         self.diameter_selection.add_widget(Label(text='Select Diameter', font_size=sp(35), color=(1, 1, 1, 1), size_hint_y=0.2))
         self.diameter_grid = GridLayout(cols=3, rows=3, size_hint_y=0.8)
@@ -475,71 +560,26 @@ class AddDiameterScreen(Screen):
         self.diameter_selection.add_widget(self.diameter_grid)
         self.layout.add_widget(self.diameter_selection)
         self.preview_layout = FloatLayout(size_hint_y=0.6)
+        self.setup_grid(self.preview_layout)
         self.layout.add_widget(self.preview_layout)
         back_btn = ContrastButton(text='Back', size_hint_y=0.1)
         back_btn.bind(on_press=self.go_to_bin_config)
         self.layout.add_widget(back_btn)
         self.add_widget(self.layout)
 
-    def _update_rect(self, instance, value):
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
+    def _update_rect(self, *args):
+        self.rect.pos = self.pos
+        self.rect.size = self.size
 
-    def on_enter(self):
-        app = App.get_running_app()
-        self.preview_layout.clear_widgets()
-        self.preview_layout.canvas.clear()
-
-        preview_width = self.preview_layout.width * 0.8
-        preview_height = self.preview_layout.height * 0.9
-        preview_x = (self.preview_layout.width - preview_width) / 2
-        preview_y = (self.preview_layout.height - preview_height) / 2 + self.layout.height * 0.15
-        with self.preview_layout.canvas.before:
-            Color(1, 1, 1, 1)
-            self.preview_rect = Rectangle(size=(preview_width, preview_height), pos=(preview_x, preview_y))
-
-        self.preview_layout.bind(size=self._update_preview_rect, pos=self._update_preview_rect)
-
-        if app.bin_data:
-            max_rows = app.max_rows
-            num_cols = 8
-            cell_width = preview_width / num_cols
-            cell_height = preview_height / max_rows
-
-            with self.preview_layout.canvas:
-                Color(0, 0, 0, 1)
-                for i in range(max_rows + 1):
-                    Line(points=[preview_x, preview_y + i * cell_height, preview_x + preview_width, preview_y + i * cell_height])
-                for i in range(num_cols + 1):
-                    Line(points=[preview_x + i * cell_width, preview_y, preview_x + i * cell_width, preview_y + preview_height])
-
-            for row in range(max_rows):
-                if row < len(app.bin_data):
-                    entry = app.bin_data[row]
-                    diameter = entry['diameter']
-                    items = sorted([item for item in entry['items'] if item in Config.ITEM_OPTIONS])
-                    lengths = sorted(entry['lengths'], key=convert_to_decimal)
-                    selected_items = items + lengths
-                    for col in range(min(num_cols, len(selected_items))):
-                        item_or_length = selected_items[col]
-                        size_text = f"{diameter} x {item_or_length}"
-                        item_label = Label(
-                            text=size_text,
-                            size_hint=(None, None),
-                            size=(cell_width, cell_height),
-                            pos=(preview_x + col * cell_width, preview_y + (max_rows - 1 - row) * cell_height),
-                            color=(0, 0, 0, 1)
-                        )
-                        self.preview_layout.add_widget(item_label)
-
-    def _update_preview_rect(self, instance, value):
-        preview_width = instance.width * 0.8
-        preview_height = instance.height * 0.9
-        preview_x = (instance.width - preview_width) / 2
-        preview_y = (instance.height - preview_height) / 2 + self.layout.height * 0.15
-        self.preview_rect.pos = (preview_x, preview_y)
-        self.preview_rect.size = (preview_width, preview_height)
+    def grid_geometry(self):
+        """(pos, size) of the preview box inside preview_layout."""
+        width = self.preview_layout.width * 0.8
+        height = self.preview_layout.height * 0.9
+        x = (self.preview_layout.width - width) / 2
+        y = (self.preview_layout.height - height) / 2 + self.layout.height * 0.15
+        return (x, y), (width, height)
 
+    @perf.action('select_diameter')
     def select_diameter(self, diameter):
         app = App.get_running_app()
         app.selected_diameter = diameter
@@ -548,530 +588,95 @@ class AddDiameterScreen(Screen):
     def go_to_bin_config(self, instance):
         self.manager.current = 'bin_config'
 
-class AddLengthScreen(Screen):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.layout = BoxLayout(orientation='vertical', padding=sp(20), spacing=sp(20), size_hint=(1, 1))
-        with self.canvas.before:
-            Color(0, 0, 0, 1)
-            self.rect = Rectangle(size=Window.size, pos=(0, 0))
-        self.bind(size=self._update_rect, pos=self._update_rect)
-        self.label = Label(text='', font_size=sp(35), color=(1, 1, 1, 1), size_hint_y=0.1)
-        self.grid = GridLayout(cols=4, rows=4, size_hint_y=0.5, spacing=sp(10), padding=sp(10))
-        self.button_layout = BoxLayout(orientation='horizontal', size_hint_y=0.2)
-        self.confirm_btn = ContrastButton(text='Confirm')
-        self.back_btn = ContrastButton(text='Back')
-        self.button_layout.add_widget(self.confirm_btn)
-        self.button_layout.add_widget(self.back_btn)
-        self.layout.add_widget(self.label)
-        self.layout.add_widget(self.grid)
-        self.layout.add_widget(self.button_layout)
-        self.add_widget(self.layout)
-        self.selected_lengths = set()
-        self.selected_items = set()
-
-    def _update_rect(self, instance, value):
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
-
-    def on_enter(self):
-        app = App.get_running_app()
-        diameter = app.selected_diameter
-        self.label.text = f"Select Lengths and Items for Diameter {diameter}"
-        available_lengths = Config.AVAILABLE_LENGTHS.get(diameter, [])
-        self.grid.clear_widgets()
-        self.length_buttons = {}
-        self.item_buttons = {}
-
-        for i in range(12):
-            if i < len(available_lengths):
-                length = available_lengths[i]
-                btn = ContrastButton(text=length, size_hint=(1, None), height=sp(60))
-                btn.bind(on_press=lambda x, l=length: self.toggle_selection(x, l, 'length'))
-                self.length_buttons[btn] = length
-                if length in self.selected_lengths:
-                    btn.text = f"{length} [X]"
-                self.grid.add_widget(btn)
-            else:
-                btn = Button(text='', disabled=True, size_hint=(1, None), height=sp(60))
-                self.grid.add_widget(btn)
-
-        for i, item in enumerate(Config.ITEM_OPTIONS):
-            btn = ContrastButton(text=item, size_hint=(1, None), height=sp(60))
-            btn.bind(on_press=lambda x, it=item: self.toggle_selection(x, it, 'item'))
-            self.item_buttons[btn] = item
-            if item in self.selected_items:
-                btn.text = f"{item} [X]"
-            self.grid.add_widget(btn)
-
-        self.confirm_btn.bind(on_press=self.confirm_selection)
-        self.back_btn.bind(on_press=self.go_to_add_diameter)
-
-    def toggle_selection(self, instance, value, type_):
-        if type_ == 'length':
-            target_set = self.selected_lengths
-            button_dict = self.length_buttons
-        else:
-            target_set = self.selected_items
-            button_dict = self.item_buttons
-
-        if value in target_set:
-            target_set.remove(value)
-            instance.text = value
-        else:
-            target_set.add(value)
-            instance.text = f"{value} [X]"
-
-    def confirm_selection(self, instance):
-        app = App.get_running_app()
-        diameter = app.selected_diameter
-        for entry in app.bin_data:
-            if entry['diameter'] == diameter:
-                entry['lengths'] = list(set(entry['lengths'] + list(self.selected_lengths)))
-                entry['items'] = list(set(entry['items'] + list(self.selected_items)))
-                # Update last_action for each new item/length
-                for item in self.selected_items:
-                    app.last_action = (diameter, item, 'item')
-                for length in self.selected_lengths:
-                    app.last_action = (diameter, length, 'length')
-                break
-        else:
-            app.bin_data.append({
-                'diameter': diameter,
-                'lengths': list(self.selected_lengths),
-                'items': list(self.selected_items)
-            })
-            # Update last_action for each new item/length
-            for item in self.selected_items:
-                app.last_action = (diameter, item, 'item')
-            for length in self.selected_lengths:
-                app.last_action = (diameter, length, 'length')
-        self.selected_lengths.clear()
-        self.selected_items.clear()
-        self.manager.current = 'bin_config'
-
-    def go_to_add_diameter(self, instance):
-        self.manager.current = 'add_diameter'
-
-class SummaryScreen(Screen):
+class SummaryScreen(GridScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=sp(20), spacing=sp(20), size_hint=(1, 1))
         with self.canvas.before:
             Color(0, 0, 0, 1)
             self.rect = Rectangle(size=Window.size, pos=(0, 0))
-        self.bind(size=self._update_rect, pos=self._update_rect)
+        self._trigger_rect = Clock.create_trigger(self._update_rect)
+        self.bind(size=self._trigger_rect, pos=self._trigger_rect)
         self.summary_layout = FloatLayout(size_hint_y=0.7)
+        self.setup_grid(self.summary_layout)
         self.layout.add_widget(self.summary_layout)
-        save_btn = ContrastButton(text='Save to File', size_hint=(1, 0.1))
+        save_row = BoxLayout(orientation='horizontal', spacing=sp(20), size_hint=(1, 0.1))
+        self.save_btn = save_btn = ContrastButton(text='Save to File')
+        self.docx_btn = docx_btn = ContrastButton(text='Save DOCX')
+        self.save_labels = {save_btn: save_btn.text, docx_btn: docx_btn.text}
         done_btn = ContrastButton(text='Done', size_hint=(1, 0.1))
         back_btn = ContrastButton(text='Back', size_hint=(1, 0.1))
         save_btn.bind(on_press=self.save_to_file)
-        done_btn.bind(on_press=lambda x: App.get_running_app().stop())
+        docx_btn.bind(on_press=self.save_to_docx)
+        done_btn.bind(on_press=lambda x: App.get_running_app().reset_session())
         back_btn.bind(on_press=self.go_to_bin_config)
-        self.layout.add_widget(save_btn)
+        save_row.add_widget(save_btn)
+        save_row.add_widget(docx_btn)
+        self.layout.add_widget(save_row)
         self.layout.add_widget(done_btn)
         self.layout.add_widget(back_btn)
         self.add_widget(self.layout)
-
-    def _update_rect(self, instance, value):
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
-
-    def on_enter(self):
-        app = App.get_running_app()
-        self.summary_layout.clear_widgets()
-        self.summary_layout.canvas.clear()
-
-        if app.bin_data:
-            max_rows = app.max_rows or 7
-            num_cols = 8
-            layout_width = self.summary_layout.width * 0.9  # Match BinConfigScreen width ratio
-            layout_height = max_rows * sp(50)  # Match BinConfigScreen row height
-            layout_x = (self.summary_layout.width - layout_width) / 2
-            # Target 65% from bottom of window, adjusted for layout position
-            target_y = Window.height * 0.65 - (layout_height / 2)  # Center the canvas at 65% from bottom
-            layout_y = max(0, target_y - self.summary_layout.y)  # Adjust for layout's y position
-
-            # Debug output to verify positions
-            print(f"SummaryScreen: Window.height={Window.height}, summary_layout.pos={self.summary_layout.pos}, "
-                  f"summary_layout.size={self.summary_layout.size}, layout_y={layout_y}, canvas_y={self.summary_layout.y + layout_y}")
-
-            # Use summary_layout's actual position
-            canvas_x = self.summary_layout.x + layout_x
-            canvas_y = self.summary_layout.y + layout_y
-
-            with self.summary_layout.canvas.before:
-                Color(1, 1, 1, 1)
-                self.summary_rect = Rectangle(size=(layout_width, layout_height), pos=(canvas_x, canvas_y))
-
-            self.summary_layout.bind(size=self._update_summary_rect, pos=self._update_summary_rect)
-
-            cell_width = layout_width / num_cols
-            cell_height = layout_height / max_rows
-
-            with self.summary_layout.canvas:
-                Color(0, 0, 0, 1)
-                for i in range(max_rows + 1):
-                    Line(points=[canvas_x, canvas_y + i * cell_height, canvas_x + layout_width, canvas_y + i * cell_height])
-                for i in range(num_cols + 1):
-                    Line(points=[canvas_x + i * cell_width, canvas_y, canvas_x + i * cell_width, canvas_y + layout_height])
-
-            for row in range(max_rows):
-                if row < len(app.bin_data):
-                    entry = app.bin_data[row]
-                    diameter = entry['diameter']
-                    items = sorted([item for item in entry['items'] if item in Config.ITEM_OPTIONS])
-                    lengths = sorted(entry['lengths'], key=convert_to_decimal)
-                    selected_items = items + lengths
-                    for col in range(min(num_cols, len(selected_items))):
-                        item_or_length = selected_items[col]
-                        size_text = f"{diameter} x {item_or_length}"
-                        item_label = Label(
-                            text=size_text,
-                            size_hint=(None, None),
-                            size=(cell_width, cell_height),
-                            pos=(canvas_x + col * cell_width, canvas_y + (max_rows - 1 - row) * cell_height),
-                            color=(0, 0, 0, 1),
-                            font_size=sp(14),
-                            halign='center',
-                            valign='center',
-                            text_size=(cell_width - sp(4), cell_height - sp(4))
-                        )
-                        self.summary_layout.add_widget(item_label)
-
-    def _update_summary_rect(self, instance, value):
+        # Usually pre-warmed before the customer finishes, so the first
+        # save doesn't wait on python-docx
+        preload(bin_docx.docx, bin_docx.docx_oxml, bin_docx.docx_ns)
+        # Likewise the pdflatex probe and the precompiled preamble
+        App.get_running_app().exporter.submit(bin_latex.warm)
+
+    def _update_rect(self, *args):
+        self.rect.pos = self.pos
+        self.rect.size = self.size
+
+    def grid_geometry(self):
+        """(pos, size) of the summary grid, centred 65% up the window."""
+        max_rows = App.get_running_app().max_rows or 7
+        width = self.summary_layout.width * 0.9  # Match BinConfigScreen width ratio
+        height = max_rows * sp(50)  # Match BinConfigScreen row height
+        x = (self.summary_layout.width - width) / 2
+        target_y = Window.height * 0.65 - (height / 2)
+        y = max(0, target_y - self.summary_layout.y)  # Adjust for layout's y position
+        return (self.summary_layout.x + x, self.summary_layout.y + y), (width, height)
+
+    def show_popup(self, title, text):
+        popup = Factory.Popup(title=title, content=Label(text=text, font_size=sp(20), color=(1, 0, 0, 1)), size_hint=(0.5, 0.5), background_color=(0, 0, 0, 1))
+        popup.open()
+
+    def export(self, job, filename, kind, button):
+        # The job renders from a snapshot on the export thread; the customer
+        # can press Done and the next session start while it runs
         app = App.get_running_app()
-        max_rows = app.max_rows or 7
-        layout_width = instance.width * 0.9  # Match BinConfigScreen width ratio
-        layout_height = max_rows * sp(50)  # Match BinConfigScreen row height
-        layout_x = (instance.width - layout_width) / 2
-        # Target 65% from bottom of window, adjusted for layout position
-        target_y = Window.height * 0.65 - (layout_height / 2)  # Center the canvas at 65% from bottom
-        layout_y = max(0, target_y - instance.y)  # Adjust for layout's y position
-
-        # Use summary_layout's actual position
-        canvas_x = instance.x + layout_x
-        canvas_y = instance.y + layout_y
-        self.summary_rect.pos = (canvas_x, canvas_y)
-        self.summary_rect.size = (layout_width, layout_height)
-
+        desktop_path = os.path.join(os.path.expanduser("~"), "Desktop", filename)
+        button.text = 'Saving...'
+        app.exporter.submit(job, app.export_snapshot(), desktop_path,
+                            on_progress=lambda message: self.show_export_progress(button, message),
+                            on_done=lambda path: self.export_finished('Success', f'Configuration saved to {filename} on Desktop'),
+                            on_error=lambda e: self.export_finished('Error', f'Failed to save {kind}: {str(e)}'))
+
+    def show_export_progress(self, button, message):
+        button.text = f'Saving: {message}...'
+
+    def export_finished(self, title, text):
+        if not App.get_running_app().exporter.busy:
+            for button, label in self.save_labels.items():
+                button.text = label
+        self.show_popup(title, text)
+
+    @perf.action('save')
     def save_to_file(self, instance):
-        app = App.get_running_app()
-        data = {
-            'name': app.name or "Not specified",
-            'phone': app.phone or "Not specified",
-            'bin_size': app.bin_size or "Not specified",
-            'material': app.material or "Not specified",
-            'bin_data': app.bin_data or []
-        }
-
-        from docx import Document
-        from docx.oxml.ns import qn
-        from docx.oxml import OxmlElement
-        import os
-        import platform
-
-        # Create a new Document
-        doc = Document()
-        doc.core_properties.title = "Bolt Bin Configuration"
-        doc.core_properties.author = data['name'] or "Unknown"
-        doc.core_properties.created = datetime.datetime.now()
-
-        # Add title
-        doc.add_heading("Bolt Bin Configuration", 0)
-
-        # Add configuration details
-        doc.add_paragraph(f"Name: {data['name']}")
-        doc.add_paragraph(f"Phone: {data['phone']}")
-        doc.add_paragraph(f"Bin Size: {data['bin_size']}")
-        doc.add_paragraph(f"Material: {data['material']}")
-
-        # Add table for bin data
-        table = doc.add_table(rows=1, cols=2)
-        table.style = 'Table Grid'
-        hdr_cells = table.rows[0].cells
-        hdr_cells[0].text = "Diameter"
-        hdr_cells[1].text = "Items/Lengths"
-
-        if data['bin_data']:
-            for entry in data['bin_data']:
-                diameter = entry.get('diameter', 'N/A')
-                items = sorted([item for item in entry.get('items', []) if item in Config.ITEM_OPTIONS])
-                lengths = sorted(entry.get('lengths', []), key=convert_to_decimal)
-                selected_items = items + lengths
-                if selected_items:
-                    row_cells = table.add_row().cells
-                    row_cells[0].text = diameter
-                    row_cells[1].text = ', '.join(selected_items)
-        else:
-            row_cells = table.add_row().cells
-            row_cells[0].text = "None"
-            row_cells[1].text = "N/A"
-
-        # Set table width to 100% of page
-        table.autofit = False
-        table_width = OxmlElement('w:tblW')
-        table_width.set(qn('w:w'), '5000')
-        table_width.set(qn('w:type'), 'pct')
-        table._tblPr.append(table_width)
-
-        # Save to desktop
-        if platform.system() == "Darwin":  # macOS
-            desktop_path = os.path.join(os.path.expanduser("~"), "Desktop", "bin_config.docx")
-        else:
-            desktop_path = os.path.join(os.path.expanduser("~"), "Desktop", "bin_config.docx")
-
-        try:
-            doc.save(desktop_path)
-            popup = Popup(title='Success', content=Label(text='Configuration saved to bin_config.docx on Desktop', font_size=sp(20), color=(1, 0, 0, 1)), size_hint=(0.5, 0.5), background_color=(0, 0, 0, 1))
-            popup.open()
-        except Exception as e:
-            print(f"Error during save: {str(e)}")  # Debug output
-            popup = Popup(title='Error', content=Label(text=f'Failed to save DOCX: {str(e)}', font_size=sp(20), color=(1, 0, 0, 1)), size_hint=(0.5, 0.5), background_color=(0, 0, 0, 1))
-            popup.open()
-
-    def go_to_bin_config(self, instance):
-        self.manager.current = 'bin_config'
+        self.export(bin_latex.write_latex_pdf, 'bin_config.pdf', 'PDF', self.save_btn)
 
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.layout = BoxLayout(orientation='vertical', padding=sp(20), spacing=sp(20), size_hint=(1, 1))
-        with self.canvas.before:
-            Color(0, 0, 0, 1)
-            self.rect = Rectangle(size=Window.size, pos=(0, 0))
-        self.bind(size=self._update_rect, pos=self._update_rect)
-        self.summary_layout = FloatLayout(size_hint_y=0.7)
-        self.layout.add_widget(self.summary_layout)
-        save_btn = ContrastButton(text='Save to File', size_hint=(1, 0.1))
-        done_btn = ContrastButton(text='Done', size_hint=(1, 0.1))
-        back_btn = ContrastButton(text='Back', size_hint=(1, 0.1))
-        save_btn.bind(on_press=self.save_to_file)
-        done_btn.bind(on_press=lambda x: App.get_running_app().stop())
-        back_btn.bind(on_press=self.go_to_bin_config)
-        self.layout.add_widget(save_btn)
-        self.layout.add_widget(done_btn)
-        self.layout.add_widget(back_btn)
-        self.add_widget(self.layout)
-
-    def _update_rect(self, instance, value):
-        self.rect.pos = instance.pos
-        self.rect.size = instance.size
-
-    def on_enter(self):
-        app = App.get_running_app()
-        self.summary_layout.clear_widgets()
-        self.summary_layout.canvas.clear()
-
-        if app.bin_data:
-            max_rows = app.max_rows or 7
-            num_cols = 8
-            layout_width = self.summary_layout.width * 0.9  # Match BinConfigScreen width ratio
-            layout_height = max_rows * sp(50)  # Match BinConfigScreen row height
-            layout_x = (self.summary_layout.width - layout_width) / 2
-            # Target 65% from bottom of window, adjusted for layout position
-            target_y = Window.height * 0.65 - (layout_height / 2)  # Center the canvas at 65% from bottom
-            layout_y = max(0, target_y - self.summary_layout.y)  # Adjust for layout's y position
-
-            # Debug output to verify positions
-            print(f"SummaryScreen: Window.height={Window.height}, summary_layout.pos={self.summary_layout.pos}, "
-                  f"summary_layout.size={self.summary_layout.size}, layout_y={layout_y}, canvas_y={self.summary_layout.y + layout_y}")
-
-            # Use summary_layout's actual position
-            canvas_x = self.summary_layout.x + layout_x
-            canvas_y = self.summary_layout.y + layout_y
-
-            with self.summary_layout.canvas.before:
-                Color(1, 1, 1, 1)
-                self.summary_rect = Rectangle(size=(layout_width, layout_height), pos=(canvas_x, canvas_y))
-
-            self.summary_layout.bind(size=self._update_summary_rect, pos=self._update_summary_rect)
-
-            cell_width = layout_width / num_cols
-            cell_height = layout_height / max_rows
-
-            with self.summary_layout.canvas:
-                Color(0, 0, 0, 1)
-                for i in range(max_rows + 1):
-                    Line(points=[canvas_x, canvas_y + i * cell_height, canvas_x + layout_width, canvas_y + i * cell_height])
-                for i in range(num_cols + 1):
-                    Line(points=[canvas_x + i * cell_width, canvas_y, canvas_x + i * cell_width, canvas_y + layout_height])
-
-            for row in range(max_rows):
-                if row < len(app.bin_data):
-                    entry = app.bin_data[row]
-                    diameter = entry['diameter']
-                    items = sorted([item for item in entry['items'] if item in Config.ITEM_OPTIONS])
-                    lengths = sorted(entry['lengths'], key=convert_to_decimal)
-                    selected_items = items + lengths
-                    for col in range(min(num_cols, len(selected_items))):
-                        item_or_length = selected_items[col]
-                        size_text = f"{diameter} x {item_or_length}"
-                        item_label = Label(
-                            text=size_text,
-                            size_hint=(None, None),
-                            size=(cell_width, cell_height),
-                            pos=(canvas_x + col * cell_width, canvas_y + (max_rows - 1 - row) * cell_height),
-                            color=(0, 0, 0, 1),
-                            font_size=sp(14),
-                            halign='center',
-                            valign='center',
-                            text_size=(cell_width - sp(4), cell_height - sp(4))
-                        )
-                        self.summary_layout.add_widget(item_label)
-
-    def _update_summary_rect(self, instance, value):
-        app = App.get_running_app()
-        max_rows = app.max_rows or 7
-        layout_width = instance.width * 0.9  # Match BinConfigScreen width ratio
-        layout_height = max_rows * sp(50)  # Match BinConfigScreen row height
-        layout_x = (instance.width - layout_width) / 2
-        # Target 65% from bottom of window, adjusted for layout position
-        target_y = Window.height * 0.65 - (layout_height / 2)  # Center the canvas at 65% from bottom
-        layout_y = max(0, target_y - instance.y)  # Adjust for layout's y position
-
-        # Use summary_layout's actual position
-        canvas_x = instance.x + layout_x
-        canvas_y = instance.y + layout_y
-        self.summary_rect.pos = (canvas_x, canvas_y)
-        self.summary_rect.size = (layout_width, layout_height)
-
-    def save_to_file(self, instance):
-        app = App.get_running_app()
-        data = {
-            'name': app.name or "Not specified",
-            'phone': app.phone or "Not specified",
-            'bin_size': app.bin_size or "Not specified",
-            'material': app.material or "Not specified",
-            'bin_data': app.bin_data or []
-        }
-        # Raw LaTeX template before formatting
-        raw_latex = r"""
-\documentclass[a4paper,12pt]{article}
-\usepackage[utf8]{inputenc}
-\usepackage{geometry}
-\geometry{a4paper, margin=1in}
-\usepackage{booktabs}
-\usepackage{longtable}
-\usepackage{array}
-\usepackage{colortbl}
-\usepackage{xcolor}
-
-% Configuring fonts last
-\usepackage{times} % Reliable serif font
-
-\begin{document}
-
-\section*{Bolt Bin Configuration}
-
-\textbf{Name:} {name}
-\textbf{Phone:} {phone}
-\textbf{Bin Size:} {bin_size}
-\textbf{Material:} {material}
-
-\begin{longtable}{|p{2cm}|p{10cm}|}
-\hline
-\rowcolor{gray!20}
-\textbf{Diameter} & \textbf{Items/Lengths} \\ \hline
-\endhead
-
-{bin_table}
-\hline
-\end{longtable}
-
-\end{document}
-"""
-        # Debug: Print raw template and data
-        print(f"Raw LaTeX template: {raw_latex}")
-        print(f"Data: {data}")
-        # Format the LaTeX content
-        try:
-            latex_content = raw_latex.format(
-                name=data['name'],
-                phone=data['phone'],
-                bin_size=data['bin_size'],
-                material=data['material'],
-                bin_table=''.join(
-                    f"{diameter} & {', '.join(sorted(items + lengths))}\\\\ \hline\n" 
-                    for entry in data['bin_data'] 
-                    for diameter, items, lengths in [(entry.get('diameter', 'N/A'), entry.get('items', []), entry.get('lengths', []))] 
-                    if entry.get('items') or entry.get('lengths')
-                ) or r"None & N/A \\ \hline"
-            )
-            print(f"Formatted LaTeX: {latex_content}")
-        except KeyError as e:
-            print(f"KeyError during formatting: {e}")
-            raise  # Re-raise to show the popup
-
-        import os
-        import platform
-        import subprocess
-        import tempfile
-        if platform.system() == "Windows":
-            desktop_path = os.path.join(os.path.expanduser("~"), "Desktop", "bin_config.pdf")
-        else:
-            desktop_path = os.path.join(os.path.expanduser("~"), "Desktop", "bin_config.pdf")
-
-        # Use a temporary directory for LaTeX files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_tex = os.path.join(temp_dir, "temp.tex")
-            with open(temp_tex, "w", encoding='utf-8') as f:
-                f.write(latex_content)
-
-            try:
-                # Check if pdflatex is available
-                result = subprocess.run(["pdflatex", "-version"], capture_output=True, text=True)
-                if result.returncode != 0:
-                    raise Exception("pdflatex not found. Please install TeX Live or MiKTeX. (e.g., 'brew install basictex' on macOS, or MiKTeX on Windows)")
-
-                # Compile LaTeX to PDF
-                compile_result = subprocess.run(["pdflatex", "-output-directory", temp_dir, temp_tex], 
-                                              capture_output=True, text=True, check=True)
-                print(f"pdflatex output: {compile_result.stdout}")
-                if compile_result.returncode != 0:
-                    raise Exception(f"pdflatex compilation failed: {compile_result.stderr}")
-
-                temp_pdf = os.path.join(temp_dir, "temp.pdf")
-                os.rename(temp_pdf, desktop_path)
-                popup = Popup(title='Success', content=Label(text='Configuration saved to bin_config.pdf on Desktop', font_size=sp(20), color=(1, 0, 0, 1)), size_hint=(0.5, 0.5), background_color=(0, 0, 0, 1))
-                popup.open()
-            except Exception as e:
-                print(f"Error during save: {str(e)}")  # Debug output
-                popup = Popup(title='Error', content=Label(text=f'Failed to save PDF: {str(e)}', font_size=sp(20), color=(1, 0, 0, 1)), size_hint=(0.5, 0.5), background_color=(0, 0, 0, 1))
-                popup.open()
+    @perf.action('save_docx')
+    def save_to_docx(self, instance):
+        self.export(bin_docx.write_docx, 'bin_config.docx', 'DOCX', self.docx_btn)
 
     def go_to_bin_config(self, instance):
         self.manager.current = 'bin_config'
 
 
 
-
-class BoltBinApp(App):
-    name = StringProperty('')
-    phone = StringProperty('')
-    bin_size = StringProperty('')
-    material = StringProperty('')
-    bin_data = ListProperty([])
-    max_rows = NumericProperty(7)
-    diameters = ListProperty(Config.DIAMETERS)
-    materials = ListProperty(Config.MATERIALS)
-    available_lengths = Config.AVAILABLE_LENGTHS
-    item_options = ListProperty(Config.ITEM_OPTIONS)
-    selected_diameter = StringProperty('')
-    last_action = None  # Store (diameter, value, type) for undo
-
-    def build(self):
-        Window.maximize()
-        sm = ScreenManager()
-        sm.add_widget(StartScreen(name='start'))
-        sm.add_widget(BinSizeScreen(name='bin_size'))
-        sm.add_widget(MaterialScreen(name='material'))
-        sm.add_widget(BinConfigScreen(name='bin_config'))
-        sm.add_widget(AddDiameterScreen(name='add_diameter'))
-        sm.add_widget(AddLengthScreen(name='add_length'))
-        sm.add_widget(SummaryScreen(name='summary'))
-        return sm
-
 if __name__ == '__main__':
-    BoltBinApp().run()
+    try:
+        BoltBinApp().run()
+    except Exception:
+        log.exception("BoltBinApp crashed")
+        dump_recent()  # Last events leading up to the crash
+        raise
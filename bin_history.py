@@ -0,0 +1,86 @@
+"""Undo/redo history for the Kivy app's bin_data.
+
+Every confirm on the length screen is recorded as one BinEdit: the row it
+touched and the bits it newly set.  A diameter -> position index finds
+that row directly, so undo and redo each change exactly one row.
+"""
+from collections import namedtuple
+
+from bin_rows import BinRow
+
+# diameter/position: row touched, bits: selections newly set,
+# created: the edit added the row
+BinEdit = namedtuple('BinEdit', ['diameter', 'position', 'bits', 'created'])
+
+
+class BinHistory:
+    """Command stack over a list of BinRows, indexed by diameter."""
+
+    def __init__(self, rows=None):
+        self.rows = rows if rows is not None else []
+        self.positions = {row.diameter: i for i, row in enumerate(self.rows)}
+        self.undo_stack = []
+        self.redo_stack = []
+
+    def row(self, diameter):
+        position = self.positions.get(diameter)
+        return None if position is None else self.rows[position]
+
+    def _append_row(self, diameter):
+        row = BinRow(diameter)
+        self.positions[diameter] = len(self.rows)
+        self.rows.append(row)
+        return row
+
+    def _pop_row(self, diameter):
+        # Rows are only created at the end and undone newest first, so a
+        # created row is always the last one when its edit is undone.
+        position = self.positions.pop(diameter)
+        assert position == len(self.rows) - 1
+        self.rows.pop()
+
+    def apply(self, diameter, values):
+        """Select values on the diameter's row as one undoable step.
+
+        Returns the recorded BinEdit, or None if nothing changed.
+        """
+        row = self.row(diameter)
+        created = row is None
+        if created:
+            row = self._append_row(diameter)
+        bits = row.add_all(values)
+        if not bits and not created:
+            return None
+        edit = BinEdit(diameter, self.positions[diameter], bits, created)
+        self.undo_stack.append(edit)
+        self.redo_stack.clear()
+        return edit
+
+    def undo(self):
+        """Revert the most recent edit; returns it, or None if there is none."""
+        if not self.undo_stack:
+            return None
+        edit = self.undo_stack.pop()
+        if edit.created:
+            self._pop_row(edit.diameter)
+        else:
+            self.row(edit.diameter).clear_bits(edit.bits)
+        self.redo_stack.append(edit)
+        return edit
+
+    def redo(self):
+        """Re-apply the most recently undone edit; returns it, or None."""
+        if not self.redo_stack:
+            return None
+        edit = self.redo_stack.pop()
+        row = self._append_row(edit.diameter) if edit.created else self.row(edit.diameter)
+        row.mask |= edit.bits
+        self.undo_stack.append(edit)
+        return edit
+
+    def clear(self):
+        """Forget all rows and history."""
+        del self.rows[:]
+        self.positions.clear()
+        self.undo_stack.clear()
+        self.redo_stack.clear()
@@ -0,0 +1,90 @@
+"""Deferred imports for the export libraries, and an import-time profiler.
+
+reportlab and python-docx are only needed when a customer saves or
+prints, so the apps bind them with lazy_import() and pay for them on
+first use -- or earlier, off the UI thread, via preload().
+
+    python bin_imports.py bin_generator_6 [count]
+
+imports the given module in a fresh interpreter under -X importtime and
+lists the `count` modules with the largest cumulative import time.
+"""
+import importlib
+import subprocess
+import sys
+import threading
+
+
+class LazyModule:
+    """Stands in for a module until one of its attributes is first used."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<LazyModule '{self._name}' ({state})>"
+
+
+def lazy_import(name):
+    """Module proxy for name; a missing module raises ImportError on first use."""
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
+
+
+def preload(*modules):
+    """Load LazyModules on a daemon thread so the first export doesn't stall."""
+    def run():
+        for module in modules:
+            try:
+                module.load()
+            except ImportError:
+                pass  # Reported when the export actually needs it
+    pending = [module for module in modules if isinstance(module, LazyModule)]
+    if pending:
+        threading.Thread(target=run, name='preload', daemon=True).start()
+
+
+def import_times(module):
+    """[(cumulative_us, self_us, name)] for importing module in a fresh interpreter."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True)
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # Column header
+        times.append((cumulative_us, self_us, fields[2].strip()))
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+    return times
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("usage: python bin_imports.py MODULE [count]", file=sys.stderr)
+        return 2
+    count = int(argv[1]) if len(argv) > 1 else 25
+    times = sorted(import_times(argv[0]), reverse=True)
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for cumulative_us, self_us, name in times[:count]:
+        print(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {name}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
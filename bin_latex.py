@@ -0,0 +1,200 @@
+"""pdflatex export for the Kivy summary, kept warm between saves.
+
+A cold pdflatex run spends most of its time loading the preamble's
+packages.  The fixed preamble is dumped once into a format file in a
+per-user scratch directory (``pdflatex -ini ... \\dump``) and each save
+compiles only the document body against it.  The format's name includes
+a hash of the preamble and the pdflatex version, so upgrading TeX or
+editing PREAMBLE builds a fresh one.  Each save checks the file is still
+there and rebuilds it if a cache cleaner removed it; if the format can't
+be built, or a compile against it fails where the full document doesn't,
+saves fall back to compiling the full document.
+
+Finished PDFs go into the export cache keyed by the template and the
+snapshot, so saving the same summary again doesn't run pdflatex at all.
+The pdflatex probe runs once per process, and a missing pdflatex is
+remembered too.  All compiles happen on the export thread, one at a
+time, so the scratch directory isn't shared.
+
+    BOLT_BIN_LATEX_DIR  scratch directory (default ~/.cache/bolt_bin/latex)
+"""
+import functools
+import hashlib
+import os
+import shutil
+import subprocess
+
+from bin_cache import export_cache, export_key
+from bin_log import get_logger
+
+log = get_logger('latex')
+
+SCRATCH_DIR = os.environ.get('BOLT_BIN_LATEX_DIR') or os.path.join(
+    os.path.expanduser('~'), '.cache', 'bolt_bin', 'latex')
+JOB_NAME = 'bin_config'
+
+PREAMBLE = r"""\documentclass[a4paper,12pt]{article}
+\usepackage[utf8]{inputenc}
+\usepackage{geometry}
+\geometry{a4paper, margin=1in}
+\usepackage{booktabs}
+\usepackage{longtable}
+\usepackage{array}
+\usepackage{colortbl}
+\usepackage{xcolor}
+
+% Configuring fonts last
+\usepackage{times} % Reliable serif font
+"""
+
+# Filled by plain replacement, not str.format: the LaTeX is full of braces
+BODY = r"""\begin{document}
+
+\section*{Bolt Bin Configuration}
+
+\textbf{Name:} @name@
+\textbf{Phone:} @phone@
+\textbf{Bin Size:} @bin_size@
+\textbf{Material:} @material@
+
+\begin{longtable}{|p{2cm}|p{10cm}|}
+\hline
+\rowcolor{gray!20}
+\textbf{Diameter} & \textbf{Items/Lengths} \\ \hline
+\endhead
+
+@bin_table@
+\hline
+\end{longtable}
+
+\end{document}
+"""
+
+_SPECIALS = {
+    '\\': r'\textbackslash{}', '&': r'\&', '%': r'\%', '$': r'\$', '#': r'\#',
+    '_': r'\_', '{': r'\{', '}': r'\}', '~': r'\textasciitilde{}', '^': r'\textasciicircum{}',
+}
+
+
+def escape(text):
+    """Text with LaTeX's special characters escaped."""
+    return ''.join(_SPECIALS.get(char, char) for char in str(text))
+
+
+_probe = None  # (found, first line of `pdflatex -version`) once probed
+_format_failed = False  # The preamble format couldn't be built or used; don't retry every save
+
+
+def pdflatex_version():
+    """First line of `pdflatex -version`; probed once per process, found or not."""
+    global _probe
+    if _probe is None:
+        try:
+            result = subprocess.run(["pdflatex", "-version"], capture_output=True, text=True)
+        except OSError:
+            result = None
+        found = result is not None and result.returncode == 0
+        _probe = (found, result.stdout.splitlines()[0] if found and result.stdout else '')
+    if not _probe[0]:
+        raise Exception("pdflatex not found. Please install TeX Live or MiKTeX. (e.g., 'brew install basictex' on macOS, or MiKTeX on Windows)")
+    return _probe[1]
+
+
+def _run(args):
+    return subprocess.run(["pdflatex", "-interaction=nonstopmode", "-halt-on-error",
+                           "-output-directory", SCRATCH_DIR] + args,
+                          cwd=SCRATCH_DIR, capture_output=True, text=True)
+
+
+@functools.lru_cache(maxsize=None)
+def format_name():
+    digest = hashlib.sha1((pdflatex_version() + PREAMBLE).encode('utf-8')).hexdigest()[:12]
+    return f"bolt_bin_preamble_{digest}"
+
+
+def preamble_format():
+    """Name of the precompiled preamble format, or None if it couldn't be built.
+
+    Checked on every call: a long-running kiosk outlives files in a cache
+    directory, so a missing .fmt is rebuilt rather than assumed.
+    """
+    global _format_failed
+    name = format_name()
+    os.makedirs(SCRATCH_DIR, exist_ok=True)
+    if _format_failed:
+        return None
+    if os.path.exists(os.path.join(SCRATCH_DIR, name + '.fmt')):
+        return name
+    with open(os.path.join(SCRATCH_DIR, name + '.tex'), 'w', encoding='utf-8') as f:
+        f.write(PREAMBLE + "\\dump\n")
+    result = _run(["-ini", f"-jobname={name}", f"&pdflatex {name}.tex"])
+    if result.returncode != 0 or not os.path.exists(os.path.join(SCRATCH_DIR, name + '.fmt')):
+        log.warning("Could not build the LaTeX preamble format; compiling the full document instead")
+        log.debug("pdflatex -ini output: %s", result.stdout)
+        _format_failed = True
+        return None
+    log.info("Built LaTeX preamble format %s", name)
+    return name
+
+
+def warm(progress=None):
+    """Export job: probe pdflatex and build the preamble format ahead of the first save."""
+    try:
+        preamble_format()
+    except Exception as e:
+        log.warning("pdflatex not ready: %s", e)
+
+
+def render_body(snapshot):
+    bin_table = ''.join(
+        f"{escape(diameter)} & {escape(', '.join(values))}\\\\ \\hline\n"
+        for diameter, values in snapshot.entries
+    ) or "None & N/A \\\\ \\hline"
+    body = BODY
+    for field, value in (('name', escape(snapshot.name)), ('phone', escape(snapshot.phone)),
+                         ('bin_size', escape(snapshot.bin_size)), ('material', escape(snapshot.material)),
+                         ('bin_table', bin_table)):
+        body = body.replace(f"@{field}@", value)
+    return body
+
+
+def _compile(fmt, body):
+    with open(os.path.join(SCRATCH_DIR, JOB_NAME + '.tex'), 'w', encoding='utf-8') as f:
+        f.write(body if fmt else PREAMBLE + body)
+    result = _run(([f"-fmt={fmt}"] if fmt else []) + [JOB_NAME + '.tex'])
+    log.debug("pdflatex output: %s", result.stdout)
+    return result
+
+
+def compile_pdf(snapshot, progress=None):
+    """Typeset the summary and return the path of the PDF in the scratch directory."""
+    global _format_failed
+    fmt = preamble_format()
+    body = render_body(snapshot)
+    log.debug("LaTeX document: %s", body)
+    if progress:
+        progress("Running pdflatex")
+    result = _compile(fmt, body)
+    if result.returncode != 0 and fmt:
+        # A format from another TeX build, or a truncated one, fails every
+        # save; if the full document compiles, stop using it
+        log.warning("pdflatex failed with the preamble format; compiling the full document instead")
+        result = _compile(None, body)
+        if result.returncode == 0:
+            _format_failed = True
+            try:
+                os.remove(os.path.join(SCRATCH_DIR, fmt + '.fmt'))
+            except OSError:
+                pass
+    if result.returncode != 0:
+        # pdflatex reports errors on stdout; the end of the log names the problem
+        raise Exception(f"pdflatex compilation failed: {result.stdout[-500:]}")
+    return os.path.join(SCRATCH_DIR, JOB_NAME + '.pdf')
+
+
+def write_latex_pdf(snapshot, desktop_path, progress=None):
+    """Export job: typeset the summary with pdflatex and copy the PDF to desktop_path."""
+    key = export_key('latex-pdf', PREAMBLE, BODY, snapshot)
+    path = export_cache.fetch(key, '.pdf', lambda path: shutil.copyfile(compile_pdf(snapshot, progress), path))
+    shutil.copyfile(path, desktop_path)
+    return desktop_path
@@ -0,0 +1,198 @@
+"""Headless bin layout engine.
+
+Turns the bin contents kept by the front ends (the Kivy app's ``bin_data``
+list of BinRows, or the Tk apps' ``bolts`` list of tuples) into a rows x cols
+matrix of cells.  The matrix is built once per change and every screen and
+exporter draws from it instead of re-sorting and re-formatting on its own.
+
+Run as a script to lay out saved bins without a GUI::
+
+    python bin_layout.py bin.json [more.json ...]
+
+where each file holds ``{"bin_size": "56", "bin_data": [...]}``.
+"""
+import json
+import sys
+import weakref
+from collections import namedtuple
+
+from bin_rows import SLOTS, BinRow
+
+NUM_COLS = 8
+BIN_ROWS = {'56': 7, '72': 9}
+
+# text: what the cell shows
+# kind: 'item', 'length', 'blank' (reserved but unlabelled) or 'empty'
+# order: column of the value in the row's sorted contents (None when empty)
+Cell = namedtuple('Cell', ['text', 'kind', 'order'])
+EMPTY_CELL = Cell('', 'empty', None)
+
+# Tk front ends keep items in a fixed column order and draw abbreviations
+TK_ITEM_ORDER = ["Nut", "Flatwasher", "Lockwasher", "Locknut", "Blank"]
+TK_ITEM_CHARS = {"Nut": "N", "Flatwasher": "F", "Lockwasher": "L", "Locknut": "LN"}
+
+
+def max_rows_for(bin_size):
+    """Number of diameter rows in a bin with the given hole count."""
+    return BIN_ROWS.get(str(bin_size), 7)
+
+
+class BinLayout:
+    """Precomputed cell matrix for one bin.
+
+    ``cells`` holds ``rows`` tuples of ``cols`` cells.  ``entries`` holds a
+    ``(label, values)`` pair for every bin entry, including any beyond the
+    last grid row, with ``values`` in display order for text exporters.
+
+    A layout made by relayout_row() remembers the one it was derived from,
+    so a renderer still showing that one need only redraw the changed row.
+    """
+
+    def __init__(self, rows, cols, cells, entries, base=None, changed=()):
+        self.rows = rows
+        self.cols = cols
+        self.cells = cells
+        self.entries = entries
+        self._base = weakref.ref(base) if base is not None else None
+        self._changed = changed
+
+    def changed_rows(self, previous):
+        """Rows that may differ from previous, or None if every row may."""
+        if self._base is not None and self._base() is previous:
+            return self._changed
+        return None
+
+    def __iter__(self):
+        """Yield (row, col, cell) for every cell that has text to draw."""
+        for row, row_cells in enumerate(self.cells):
+            for col, cell in enumerate(row_cells):
+                if cell.text:
+                    yield row, col, cell
+
+    def label(self, row):
+        """Row header text, or '' for a row with no entry."""
+        if row < len(self.entries):
+            return self.entries[row][0]
+        return ''
+
+
+def _pad(row_cells, cols):
+    return tuple(row_cells[:cols]) + (EMPTY_CELL,) * (cols - len(row_cells))
+
+
+def cell_text(diameter, value):
+    return f"{diameter} x {value}"
+
+
+def cell_vocabulary():
+    """Every text a Kivy grid cell can show, for pre-rendering."""
+    return [cell_text(diameter, value) for diameter, values in SLOTS.items() for value in values]
+
+
+def layout_bin_data(bin_data, max_rows, num_cols=NUM_COLS):
+    """Lay out the Kivy app's bin_data (BinRows), one diameter per row.
+
+    Items come first in alphabetical order, then lengths from shortest to
+    longest; each cell reads "<diameter> x <item or length>".
+    """
+    cells = []
+    entries = []
+    for row, entry in enumerate(bin_data):
+        entries.append(_bin_entry(entry))
+        if row < max_rows:
+            cells.append(_bin_row_cells(entries[-1], len(entry.items), num_cols))
+    while len(cells) < max_rows:
+        cells.append(_pad([], num_cols))
+    return BinLayout(max_rows, num_cols, tuple(cells), tuple(entries))
+
+
+def relayout_row(layout, bin_data, position):
+    """layout with only row position laid out again from bin_data.
+
+    For an edit confined to one row: undo and redo change one row's
+    selections, or add or drop the last row, so no other row moves.
+    """
+    entries = layout.entries[:position]
+    if position < len(bin_data):
+        entry = bin_data[position]
+        entries += (_bin_entry(entry),) + layout.entries[position + 1:]
+        row_cells = _bin_row_cells(entries[position], len(entry.items), layout.cols)
+    else:
+        row_cells = _pad([], layout.cols)
+    cells, changed = layout.cells, ()
+    if position < layout.rows:
+        cells, changed = cells[:position] + (row_cells,) + cells[position + 1:], (position,)
+    return BinLayout(layout.rows, layout.cols, cells, entries, base=layout, changed=changed)
+
+
+def _bin_entry(entry):
+    return entry.diameter, tuple(entry)
+
+
+def _bin_row_cells(bin_entry, num_items, num_cols):
+    diameter, values = bin_entry
+    return _pad([
+        Cell(cell_text(diameter, value), 'item' if col < num_items else 'length', col)
+        for col, value in enumerate(values)
+    ], num_cols)
+
+
+def layout_bolts(bolts, rows, max_items, max_lengths, format_number):
+    """Lay out the Tk apps' bolts list of (size, lengths, items) tuples.
+
+    Items fill the leading columns in TK_ITEM_ORDER ("Blank" reserves a
+    column without a label) and lengths follow.  ``format_number`` turns the
+    stored sizes and lengths back into fraction strings.
+    """
+    cols = max_items + max_lengths
+    cells = []
+    entries = bolt_entries(bolts, format_number)
+    for (size, lengths, items), (_, values) in zip(bolts[:rows], entries):
+        length_strs = values[len(items):]
+        item_list = [item for item in TK_ITEM_ORDER if item in items]
+        row_cells = []
+        for col, item in enumerate(item_list[:max_items]):
+            if item == "Blank":
+                row_cells.append(Cell('', 'blank', col))
+            else:
+                row_cells.append(Cell(TK_ITEM_CHARS[item], 'item', col))
+        # Lengths start after every item column, including any not shown
+        row_cells += [EMPTY_CELL] * (len(item_list) - len(row_cells))
+        start_col = len(row_cells)
+        row_cells += [Cell(text, 'length', start_col + j)
+                      for j, text in enumerate(length_strs[:max_lengths])]
+        cells.append(_pad(row_cells, cols))
+    while len(cells) < rows:
+        cells.append(_pad([], cols))
+    return BinLayout(rows, cols, tuple(cells), entries)
+
+
+def bolt_entries(bolts, format_number):
+    """(size, values) pairs for the Tk bolts list, as listed in reports."""
+    return tuple(
+        (format_number(size), tuple(sorted(items)) + tuple(format_number(length) for length in lengths))
+        for size, lengths, items in bolts
+    )
+
+
+def render_text(layout, width=14):
+    """Plain-text rendering of a layout, one line per row."""
+    lines = []
+    for row, row_cells in enumerate(layout.cells):
+        line = f"{layout.label(row):>6} | " + " | ".join(cell.text.ljust(width) for cell in row_cells)
+        lines.append(line.rstrip())
+    return "\n".join(lines)
+
+
+def main(argv):
+    for path in argv:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        bin_data = [BinRow.from_dict(entry) for entry in data.get('bin_data', [])]
+        layout = layout_bin_data(bin_data, max_rows_for(data.get('bin_size', '56')))
+        print(f"== {path}")
+        print(render_text(layout))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
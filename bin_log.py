@@ -0,0 +1,76 @@
+"""Logging for the bolt bin apps.
+
+Call sites pass %-style arguments (log.debug("x=%s", x)) so a message is
+only formatted when some handler actually emits it; a disabled level
+costs one integer comparison.  Records at or above the ring level are
+also kept, unformatted, in a bounded in-memory ring so the last events
+can be pulled after an incident even on a kiosk whose console is quiet.
+
+Levels come from the environment:
+    BOLT_BIN_LOG       console level (default WARNING)
+    BOLT_BIN_LOG_RING  ring level (default INFO)
+"""
+import collections
+import logging
+import os
+import sys
+
+RING_SIZE = 500
+FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+
+
+class RingHandler(logging.Handler):
+    """Keeps the last `capacity` records; formatting is deferred to recent()."""
+
+    def __init__(self, capacity=RING_SIZE, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = collections.deque(maxlen=capacity)
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def recent(self, count=None):
+        records = list(self.records)
+        if count is not None:
+            records = records[-count:]
+        return [self.format(record) for record in records]
+
+
+def _level(name, default):
+    value = os.environ.get(name, default).upper()
+    level = logging.getLevelName(value)
+    return level if isinstance(level, int) else logging.getLevelName(default)
+
+
+_root = logging.getLogger('bolt_bin')
+# Kivy installs its own root handlers; keep our records out of them
+_root.propagate = False
+
+console = logging.StreamHandler(sys.stderr)
+console.setLevel(_level('BOLT_BIN_LOG', 'WARNING'))
+console.setFormatter(logging.Formatter(FORMAT))
+ring = RingHandler(level=_level('BOLT_BIN_LOG_RING', 'INFO'))
+ring.setFormatter(logging.Formatter(FORMAT))
+_root.addHandler(console)
+_root.addHandler(ring)
+# The logger itself filters at the lower of the two levels, so anything
+# below both is dropped before a LogRecord is even created
+_root.setLevel(min(console.level, ring.level))
+
+
+def get_logger(name):
+    """Logger under the shared 'bolt_bin' hierarchy, e.g. get_logger('summary')."""
+    return _root.getChild(name)
+
+
+def recent(count=None):
+    """The last `count` ring entries (all of them by default), oldest first."""
+    return ring.recent(count)
+
+
+def dump_recent(stream=None):
+    """Write the ring to stream (stderr by default)."""
+    stream = stream or sys.stderr
+    for line in ring.recent():
+        stream.write(line + '\n')
+    stream.flush()
@@ -0,0 +1,155 @@
+"""PDF bin sheet shared by the Tk front ends.
+
+The sheet is rendered into memory once; saving writes those bytes to the
+archive and printing streams the same bytes to lp's stdin, so neither
+path needs a temporary file.  Rendered sheets are kept in the export
+cache, so saving or printing the same bin again skips reportlab.  save()
+and send_to_printer() are written as bin_export jobs and run on the
+export thread.
+"""
+import io
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import threading
+
+from bin_cache import export_cache, export_key
+from bin_imports import lazy_import
+
+# reportlab is only needed to save or print; loaded on first use
+pagesizes = lazy_import('reportlab.lib.pagesizes')
+canvas = lazy_import('reportlab.pdfgen.canvas')
+
+
+def build_pdf(bin_size, material, layout):
+    """Render the bin sheet for a BinLayout and return the PDF bytes."""
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=pagesizes.letter)
+    c.setFont("Helvetica", 12)
+    c.drawString(100, 750, "Bolt Bin Layout - Active Bolt & Screw")
+    c.drawString(100, 730, f"Bin Size: {bin_size} slots")
+    c.drawString(100, 710, f"Material: {material}")
+
+    # List bolts and items
+    y = 690
+    for i, (size_str, values) in enumerate(layout.entries, 1):
+        contents = ", ".join(values)
+        text = f"Row {i}: {size_str}\" ({contents})"
+        c.drawString(100, y, text)
+        y -= 20
+        if y < 400:
+            c.showPage()
+            c.setFont("Helvetica", 12)
+            y = 750
+
+    # Draw grid layout
+    c.drawString(100, y, "Bin Layout:")
+    y -= 20
+    rows = layout.rows
+    cols = layout.cols
+    cell_width = 25
+    cell_height = 20
+    offset_x, offset_y = 100, y - 20
+    text_height = 5
+
+    # Draw grid lines
+    for i in range(rows + 1):
+        y_pos = offset_y - i * cell_height
+        c.line(offset_x, y_pos, offset_x + cols * cell_width, y_pos)
+    for j in range(cols + 1):
+        x_pos = offset_x + j * cell_width
+        c.line(x_pos, offset_y, x_pos, offset_y - rows * cell_height)
+
+    # Label rows with sizes
+    c.setFont("Helvetica", 10)
+    for i in range(min(len(layout.entries), rows)):
+        c.drawString(offset_x - 40, offset_y - i * cell_height - cell_height / 2 - text_height,
+                     f"{layout.label(i)}\"")
+
+    # Draw item and length cells
+    for i, j, cell in layout:
+        c.drawCentredString(offset_x + j * cell_width + cell_width / 2,
+                           offset_y - i * cell_height - cell_height / 2 - text_height, cell.text)
+
+    c.save()
+    return buffer.getvalue()
+
+
+# Seconds the Windows print handler gets to open the temporary file
+PRINT_CLEANUP_DELAY = 60
+
+# Bump when build_pdf's output changes, so cached sheets aren't reused
+RENDER_VERSION = 1
+
+
+def render(bin_size, material, layout, progress=None):
+    """(path, data) for the sheet's PDF in the export cache.
+
+    On a miss the sheet is rendered in memory and data holds the bytes,
+    which are also stored in the cache; callers use them directly instead
+    of reading the file back.  On a hit data is None.
+    """
+    key = export_key('tk-pdf', RENDER_VERSION, str(bin_size), material, layout.rows, layout.cols, layout.entries)
+    path = export_cache.get(key, '.pdf')
+    if path is not None:
+        return path, None
+    if progress:
+        progress("Rendering PDF")
+    data = build_pdf(bin_size, material, layout)
+    return export_cache.put(key, '.pdf', data), data
+
+
+def write_pdf(data, file_path):
+    with open(file_path, "wb") as f:
+        f.write(data)
+
+
+def print_pdf(data):
+    """Send PDF bytes to the default printer."""
+    system = platform.system()
+    if system in ("Linux", "Darwin"):
+        # lp reads the document from stdin
+        subprocess.run(["lp"], input=data, check=True)
+    elif system == "Windows":
+        # os.startfile needs a real file
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
+            tmp_file.write(data)
+        os.startfile(tmp_file.name, "print")
+        # startfile returns before the handler has read the file
+        _remove_later(tmp_file.name, PRINT_CLEANUP_DELAY)
+    else:
+        raise RuntimeError(f"Printing not supported on {system}.")
+
+
+def _remove_later(path, delay):
+    def remove():
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # Still held open by the print handler; left to the temp directory cleanup
+    timer = threading.Timer(delay, remove)
+    timer.daemon = True
+    timer.start()
+
+
+def save(bin_size, material, layout, file_path, progress=None):
+    """Export job: render the sheet and write it to file_path."""
+    path, data = render(bin_size, material, layout, progress)
+    if data is None:
+        shutil.copyfile(path, file_path)
+    else:
+        write_pdf(data, file_path)
+    return file_path
+
+
+def send_to_printer(bin_size, material, layout, progress=None):
+    """Export job: render the sheet and print it."""
+    path, data = render(bin_size, material, layout, progress)
+    if data is None:
+        with open(path, "rb") as f:
+            data = f.read()
+    if progress:
+        progress("Sending to printer")
+    print_pdf(data)
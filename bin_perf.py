@@ -0,0 +1,158 @@
+"""Frame-time and tap-to-paint latency measurement for the Kivy app.
+
+Off unless BOLT_BIN_PERF is set:
+    BOLT_BIN_PERF=log  record frame times and action latencies, and log
+                       their percentiles after every kiosk session reset
+                       and when the app exits
+    BOLT_BIN_PERF=hud  the same, plus a live overlay in the corner
+BOLT_BIN_PERF_FILE names a JSON file each report is also written to.
+Reports also carry the process's peak resident set size, the kiosk's
+leak metric across session resets (not available on Windows).
+Reports go to stdout through their own logger, bolt_bin.perf.report,
+which stays out of the console warnings and the incident ring.
+
+Handlers that answer a tap are wrapped with @perf.action('name').  The
+clock starts when the handler is called and stops at the next buffer
+flip, so the latency covers the handler, layout and the repaint.
+"""
+import collections
+import functools
+import json
+import logging
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from bin_log import FORMAT, get_logger
+
+# Reports are output the operator asked for, not problems: a handler of
+# their own, regardless of the console and ring levels
+report_log = get_logger('perf.report')
+report_log.setLevel(logging.INFO)
+report_log.propagate = False
+_report_handler = logging.StreamHandler(sys.stdout)
+_report_handler.setFormatter(logging.Formatter(FORMAT))
+report_log.addHandler(_report_handler)
+
+PERCENTILES = (50, 90, 99)
+FRAME_SAMPLES = 10000
+ACTION_SAMPLES = 1000
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(0, -(-pct * len(sorted_values) // 100) - 1)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def summarize(values):
+    values = sorted(values)
+    summary = {'count': len(values)}
+    for pct in PERCENTILES:
+        summary[f'p{pct}_ms'] = None if not values else round(percentile(values, pct) * 1000, 2)
+    summary['max_ms'] = round(values[-1] * 1000, 2) if values else None
+    return summary
+
+
+def max_rss_kb():
+    """Peak resident set size of this process in kB, or None where unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak  # bytes on macOS
+
+
+class PerfRecorder:
+    def __init__(self, mode=None):
+        self.mode = mode or None
+        self.frames = collections.deque(maxlen=FRAME_SAMPLES)
+        self.actions = collections.defaultdict(lambda: collections.deque(maxlen=ACTION_SAMPLES))
+        self.pending = []  # (name, start) waiting for the next flip
+        self.hud = None
+        self.window = None
+
+    @property
+    def enabled(self):
+        return self.mode is not None
+
+    def start(self):
+        """Hook into the Kivy clock and window; call from App.on_start."""
+        if not self.enabled:
+            return
+        from kivy.clock import Clock
+        from kivy.core.window import Window
+        self.window = Window
+        Clock.schedule_interval(self._frame, 0)
+        Window.bind(on_flip=self._flipped)
+        if self.mode == 'hud':
+            from kivy.uix.label import Label
+            self.hud = Label(size_hint=(None, None), size=(360, 60), pos=(0, 0), halign='left', valign='bottom',
+                             font_size=14, color=(1, 1, 0, 1))
+            self.hud.text_size = self.hud.size
+            Window.add_widget(self.hud)
+            Clock.schedule_interval(self._update_hud, 0.5)
+
+    def action(self, name):
+        """Decorator timing a tap handler from call to the repaint after it."""
+        def decorate(handler):
+            @functools.wraps(handler)
+            def wrapper(*args, **kwargs):
+                if self.enabled:
+                    self.pending.append((name, time.perf_counter()))
+                return handler(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def _frame(self, dt):
+        self.frames.append(dt)
+
+    def _flipped(self, window):
+        if self.pending:
+            now = time.perf_counter()
+            for name, start in self.pending:
+                self.actions[name].append(now - start)
+            self.pending = []
+
+    def _update_hud(self, dt):
+        # Percentiles over roughly the last two seconds of frames
+        frame = summarize(list(self.frames)[-120:])
+        latest = ', '.join(f"{name} {samples[-1] * 1000:.0f}ms" for name, samples in self.actions.items() if samples)
+        self.hud.text = f"frame p50 {frame['p50_ms']}ms p99 {frame['p99_ms']}ms\n{latest}"
+        # Keep the overlay on top of whatever screen was added since
+        if self.window.children[0] is not self.hud:
+            self.window.remove_widget(self.hud)
+            self.window.add_widget(self.hud)
+
+    def report(self):
+        return {
+            'frames': summarize(self.frames),
+            'actions': {name: summarize(samples) for name, samples in sorted(self.actions.items())},
+            'max_rss_kb': max_rss_kb(),
+        }
+
+    def export(self):
+        """Print the percentiles, and write them to BOLT_BIN_PERF_FILE if set.
+
+        Called on each session reset and from App.on_stop.
+        """
+        if not self.enabled:
+            return
+        report = self.report()
+        report_log.info("Frame times: %s", report['frames'])
+        report_log.info("Peak RSS: %s kB", report['max_rss_kb'])
+        for name, summary in report['actions'].items():
+            report_log.info("Action %s: %s", name, summary)
+        path = os.environ.get('BOLT_BIN_PERF_FILE')
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+
+
+perf = PerfRecorder(os.environ.get('BOLT_BIN_PERF'))
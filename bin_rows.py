@@ -0,0 +1,94 @@
+"""Compact bitmask representation of one bin row (one diameter).
+
+Each diameter has at most 4 items and 12 catalogue lengths, so a row's
+selections fit in a 16-bit mask.  Bits are assigned in display order --
+items alphabetically first, then lengths from shortest to longest -- so
+walking the set bits yields the row already sorted.
+"""
+from bin_catalog import Config
+
+_ITEMS = tuple(sorted(Config.ITEM_OPTIONS))
+
+# Per diameter: values in bit order, and value -> bit
+SLOTS = {}
+BITS = {}
+for _diameter in Config.DIAMETERS:
+    SLOTS[_diameter] = _ITEMS + tuple(Config.AVAILABLE_LENGTHS[_diameter])
+    BITS[_diameter] = {value: 1 << i for i, value in enumerate(SLOTS[_diameter])}
+
+ITEM_MASK = (1 << len(_ITEMS)) - 1
+
+
+class BinRow:
+    """Selected items and lengths for one diameter, stored as a bitmask."""
+
+    __slots__ = ('diameter', 'mask')
+
+    def __init__(self, diameter, mask=0):
+        if diameter not in BITS:
+            raise ValueError(f"Unknown diameter {diameter}")
+        self.diameter = diameter
+        self.mask = mask
+
+    @classmethod
+    def from_dict(cls, entry):
+        row = cls(entry['diameter'])
+        row.add_all(entry.get('items', []))
+        row.add_all(entry.get('lengths', []))
+        return row
+
+    def bit(self, value):
+        try:
+            return BITS[self.diameter][value]
+        except KeyError:
+            raise ValueError(f"{value} is not offered for diameter {self.diameter}") from None
+
+    def add_all(self, values):
+        """Select every value; returns the mask of bits newly set."""
+        new = 0
+        for value in values:
+            new |= self.bit(value)
+        new &= ~self.mask
+        self.mask |= new
+        return new
+
+    def clear_bits(self, bits):
+        self.mask &= ~bits
+
+    def __contains__(self, value):
+        bit = BITS[self.diameter].get(value)
+        return bit is not None and bool(self.mask & bit)
+
+    def values(self, mask=None):
+        """Selected values in display order (optionally restricted to mask)."""
+        mask = self.mask if mask is None else mask & self.mask
+        slots = SLOTS[self.diameter]
+        result = []
+        while mask:
+            low = mask & -mask
+            result.append(slots[low.bit_length() - 1])
+            mask ^= low
+        return result
+
+    def __iter__(self):
+        return iter(self.values())
+
+    def __len__(self):
+        return bin(self.mask).count('1')
+
+    def __bool__(self):
+        return bool(self.mask)
+
+    def __eq__(self, other):
+        return isinstance(other, BinRow) and (self.diameter, self.mask) == (other.diameter, other.mask)
+
+    def __repr__(self):
+        return f"BinRow('{self.diameter}', {self.values()})"
+
+    @property
+    def items(self):
+        return self.values(ITEM_MASK)
+
+    @property
+    def lengths(self):
+        return self.values(~ITEM_MASK)
@@ -0,0 +1,105 @@
+"""Exact fractional inch sizes such as "3/8" or "1-1/2".
+
+Sizes are stored as Fractions, so they compare exactly and no epsilon is
+needed to match a bolt diameter.  Every diameter and length in the
+catalogue is parsed once at import into two lookup tables; parsing and
+formatting catalogue sizes are dictionary hits after that.
+"""
+from fractions import Fraction
+from functools import total_ordering
+
+from bin_catalog import Config
+
+
+@total_ordering
+class Size:
+    """An exact size with its display text, e.g. Size(Fraction(3, 2)) -> "1-1/2"."""
+
+    __slots__ = ('value', 'text')
+
+    def __init__(self, value, text=None):
+        self.value = Fraction(value)
+        self.text = text or _format(self.value)
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f"Size('{self.text}')"
+
+    def __float__(self):
+        return float(self.value)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __eq__(self, other):
+        if isinstance(other, Size):
+            return self.value == other.value
+        return self.value == other
+
+    def __lt__(self, other):
+        if isinstance(other, Size):
+            return self.value < other.value
+        return self.value < other
+
+
+def _parse(text):
+    text = text.strip()
+    if '-' in text:
+        # Mixed number: the part after '-' must be a proper fraction n/d
+        whole, frac = text.split('-')
+        num, denom = (int(part) for part in frac.split('/'))
+        if not 0 < num < denom:
+            raise ValueError(f"not a proper fraction: {frac!r}")
+        return int(whole or 0) + Fraction(num, denom)
+    return Fraction(text)
+
+
+def _format(value):
+    whole, rem = divmod(value.numerator, value.denominator)
+    if not rem:
+        return str(whole)
+    frac = f"{rem}/{value.denominator}"
+    return f"{whole}-{frac}" if whole else frac
+
+
+# Interned catalogue sizes, keyed both ways
+_BY_TEXT = {}
+_BY_VALUE = {}
+
+
+def _intern(text):
+    size = _BY_VALUE.get(_parse(text))
+    if size is None:
+        size = Size(_parse(text), text)
+        _BY_VALUE[size.value] = size
+    _BY_TEXT[text] = size
+
+
+for _text in Config.DIAMETERS:
+    _intern(_text)
+for _lengths in Config.AVAILABLE_LENGTHS.values():
+    for _text in _lengths:
+        _intern(_text)
+
+
+def parse_size(text):
+    """Size for a string like "1-1/2", "3/8" or "2"; None if it doesn't parse."""
+    size = _BY_TEXT.get(text)
+    if size is not None:
+        return size
+    try:
+        value = _parse(text)
+    except (ValueError, ZeroDivisionError):
+        return None
+    return _BY_VALUE.get(value) or Size(value)
+
+
+def format_size(value):
+    """Display text for a Size, Fraction or number, e.g. 1.5 -> "1-1/2"."""
+    if isinstance(value, Size):
+        return value.text
+    value = Fraction(value)
+    size = _BY_VALUE.get(value)
+    return size.text if size is not None else _format(value)
@@ -0,0 +1,194 @@
+"""Tk helpers shared by the Tk front ends (touch_1.py, bin_generator_2.py)."""
+import queue
+from tkinter import messagebox
+
+from bin_export import ExportWorker
+from bin_layout import layout_bolts, max_rows_for
+
+
+class TkBinGrid:
+    """Bin preview on a Tk Canvas, updated in place.
+
+    Grid lines, column headers and one text item per row label and per
+    cell are created once per bin size (max_rows) and column layout.  Rows
+    past the current bolt count are hidden; when the count changes only
+    those rows' states, the vertical lines' coords and one move() to keep
+    the grid centred are touched.  Otherwise update() only calls
+    itemconfigure on the items whose text differs, so adding or removing
+    a bolt redraws a handful of items instead of the whole bin.
+    """
+
+    TAG = 'bin_grid'
+
+    def __init__(self, canvas, width, height, cell_width, cell_height, label_offset, font, header_font):
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.label_offset = label_offset
+        self.font = font
+        self.header_font = header_font
+        self.shape = None
+        self.visible_rows = 0
+        self.offset_y = 0
+        self.row_lines = []  # horizontal lines, top to bottom
+        self.col_lines = []  # vertical lines, left to right
+        self.label_items = []
+        self.cell_items = []  # by row, then column
+        self.texts = {}  # canvas item id -> text it currently shows
+
+    def update(self, layout, row_labels, headers, max_rows=None):
+        """Show layout with the given row label and column header texts.
+
+        max_rows is the most rows the bin can hold; layout.rows of them are shown.
+        """
+        max_rows = max(max_rows or 0, layout.rows)
+        shape = (max_rows, layout.cols, tuple(headers))
+        if shape != self.shape:
+            self._build(max_rows, layout.cols, headers)
+            self.shape = shape
+        self._show_rows(layout.rows)
+        for item, text in zip(self.label_items, row_labels):
+            self._set_text(item, text)
+        for row_items, row_cells in zip(self.cell_items, layout.cells):
+            for item, cell in zip(row_items, row_cells):
+                self._set_text(item, cell.text)
+
+    def _set_text(self, item, text):
+        if self.texts[item] != text:
+            self.canvas.itemconfigure(item, text=text)
+            self.texts[item] = text
+
+    def _show_rows(self, rows):
+        old = self.visible_rows
+        if rows == old:
+            return
+        canvas = self.canvas
+        # Keep the visible rows centred on the canvas
+        dy = (old - rows) * self.cell_height / 2
+        canvas.move(self.TAG, 0, dy)
+        self.offset_y += dy
+        for i in range(min(old, rows) + 1, max(old, rows) + 1):
+            canvas.itemconfigure(self.row_lines[i], state='normal' if i <= rows else 'hidden')
+        for i in range(min(old, rows), max(old, rows)):
+            state = 'normal' if i < rows else 'hidden'
+            canvas.itemconfigure(self.label_items[i], state=state)
+            for item in self.cell_items[i]:
+                canvas.itemconfigure(item, state=state)
+        bottom = self.offset_y + rows * self.cell_height
+        for item in self.col_lines:
+            x = canvas.coords(item)[0]
+            canvas.coords(item, x, self.offset_y, x, bottom)
+        self.visible_rows = rows
+
+    def _build(self, rows, cols, headers):
+        canvas = self.canvas
+        canvas.delete(self.TAG)
+        self.texts = {}
+        cell_width = self.cell_width
+        cell_height = self.cell_height
+        offset_x = (self.width - cols * cell_width) / 2
+        offset_y = (self.height - rows * cell_height) / 2
+        self.offset_y = offset_y
+        self.visible_rows = rows
+
+        # Draw grid
+        self.row_lines = []
+        for i in range(rows + 1):
+            y = offset_y + i * cell_height
+            self.row_lines.append(canvas.create_line(offset_x, y, offset_x + cols * cell_width, y,
+                                                     fill="black", tags=self.TAG))
+        self.col_lines = []
+        for j in range(cols + 1):
+            x = offset_x + j * cell_width
+            self.col_lines.append(canvas.create_line(x, offset_y, x, offset_y + rows * cell_height,
+                                                     fill="black", tags=self.TAG))
+
+        # Column headers
+        for j, header in enumerate(headers):
+            canvas.create_text(offset_x + j * cell_width + cell_width / 2, offset_y - 10,
+                               text=header, anchor="center", font=self.header_font, tags=self.TAG)
+
+        # Row labels and cells start empty; update() fills them in
+        self.label_items = []
+        self.cell_items = []
+        for i in range(rows):
+            y = offset_y + i * cell_height + cell_height / 2
+            item = canvas.create_text(offset_x - self.label_offset, y, text='', anchor="e",
+                                      font=self.font, fill="black", tags=self.TAG)
+            self.label_items.append(item)
+            self.texts[item] = ''
+            row_items = []
+            for j in range(cols):
+                item = canvas.create_text(offset_x + j * cell_width + cell_width / 2, y, text='', anchor="center",
+                                          font=self.font, fill="black", tags=self.TAG)
+                row_items.append(item)
+                self.texts[item] = ''
+            self.cell_items.append(row_items)
+
+
+class TkDispatcher:
+    """Runs callbacks posted from worker threads on the Tk main loop.
+
+    Tk calls are only safe from the thread running mainloop, so post()
+    just queues the callback and the main loop drains the queue every
+    ``interval`` milliseconds.
+    """
+
+    def __init__(self, root, interval=50):
+        self.root = root
+        self.interval = interval
+        self.calls = queue.Queue()
+        root.after(interval, self._drain)
+
+    def post(self, callback, *args):
+        self.calls.put((callback, args))
+
+    def _drain(self):
+        while True:
+            try:
+                callback, args = self.calls.get_nowait()
+            except queue.Empty:
+                break
+            callback(*args)
+        self.root.after(self.interval, self._drain)
+
+
+class TkExporter:
+    """Runs a Tk app's saves and prints off the UI thread.
+
+    status(text) shows a progress message in the app, and status(None)
+    puts back its idle display once nothing is left running.  The outcome
+    of each job is shown in a message box over parent(), if given.
+    """
+
+    def __init__(self, root, status, parent=None):
+        self.worker = ExportWorker(TkDispatcher(root).post)
+        self.status = status
+        self.parent = parent
+
+    def submit(self, job, *args, done, failed):
+        """Queue job(*args); done(result) is the success message, failed heads the error one."""
+        self.worker.submit(job, *args,
+                           on_progress=lambda message: self.status(f"{message}..."),
+                           on_done=lambda result: self._finished(messagebox.showinfo, "Success", done(result)),
+                           on_error=lambda e: self._finished(messagebox.showerror, "Error", f"{failed}: {str(e)}"))
+
+    def _finished(self, show, title, message):
+        if not self.worker.busy:
+            self.status(None)
+        options = {'parent': self.parent()} if self.parent else {}
+        show(title, message, **options)
+
+    def close(self):
+        """Call after mainloop returns: lets a save in flight finish writing."""
+        self.worker.close(timeout=30)
+
+
+def sheet_layout(bolts, bin_size, max_items, max_lengths, format_number):
+    """Snapshot of the bin for an export job, every row the bin holds.
+
+    The layout is all tuples, so edits made while the job runs don't touch it.
+    """
+    return layout_bolts(bolts, max_rows_for(int(bin_size)), max_items, max_lengths, format_number)
@@ -0,0 +1,313 @@
+"""Kivy widgets shared by the bin grid screens."""
+import weakref
+from collections import OrderedDict
+
+from kivy.core.text import Label as CoreLabel
+from kivy.graphics import (ClearBuffers, ClearColor, Color, Fbo, InstructionGroup, Mesh,
+                           PopMatrix, PushMatrix, Rectangle, Scale, Translate)
+from kivy.clock import Clock
+from kivy.metrics import sp
+from kivy.uix.screenmanager import ScreenManager
+
+
+class BindingRegistry:
+    """Idempotent bind() for handlers attached outside a widget's __init__.
+
+    Screens that bind in on_enter go through bindings.bind(); binding the
+    same (event, callback) pair to the same widget again is a no-op, so a
+    screen's fan-out stays constant however often it is visited.
+    Callbacks must be stable objects (bound methods, not fresh lambdas).
+    """
+
+    def __init__(self):
+        self.bound = weakref.WeakKeyDictionary()  # widget -> {(event, callback)}
+
+    def bind(self, widget, **handlers):
+        bound = self.bound.setdefault(widget, set())
+        for event, callback in handlers.items():
+            if (event, callback) not in bound:
+                widget.fbind(event, callback)
+                bound.add((event, callback))
+
+    def counts(self):
+        """Callbacks currently bound per (widget, event) the registry knows of.
+
+        These are all observers of the event, not just those bound here,
+        so a count that keeps growing means something else is re-binding.
+        """
+        return {(widget, event): len(widget.get_property_observers(event))
+                for widget, bound in list(self.bound.items())
+                for event in {event for event, _ in bound}}
+
+
+bindings = BindingRegistry()
+
+
+class BindingLeakCheck:
+    """Compares registry counts between calls and reports any growth."""
+
+    def __init__(self, registry=bindings):
+        self.registry = registry
+        self.last = {}
+
+    def check(self):
+        """Returns [(widget, event, before, now)] for every count that grew."""
+        counts = self.registry.counts()
+        grown = [(widget, event, self.last[widget, event], count)
+                 for (widget, event), count in counts.items()
+                 if (widget, event) in self.last and count > self.last[widget, event]]
+        self.last = counts
+        return grown
+
+
+def canvas_group(canvas, name):
+    """The InstructionGroup called name on canvas, emptied for redrawing.
+
+    Created and added on first use; later calls clear and return the same
+    group, so a screen that redraws on every visit keeps a fixed number of
+    instructions instead of appending to canvas.before each time.
+    """
+    existing = canvas.get_group(name)
+    if existing:
+        group = existing[0]
+        group.clear()
+        return group
+    group = InstructionGroup(group=name)
+    canvas.add(group)
+    return group
+
+
+class LazyScreenManager(ScreenManager):
+    """ScreenManager that constructs each screen the first time it is shown.
+
+    screen_factories maps screen name -> Screen class.  prewarm maps a
+    screen name to the screens likely to follow it; shortly after one is
+    entered the next unbuilt one is constructed on an idle frame, so the
+    customer's next tap doesn't pay for it either.
+    """
+
+    PREWARM_DELAY = 1.0  # seconds; lets the entering transition finish first
+
+    def __init__(self, screen_factories, prewarm=None, **kwargs):
+        self.screen_factories = screen_factories
+        self.prewarm = prewarm or {}
+        super().__init__(**kwargs)
+
+    def ensure_screen(self, name):
+        if not self.has_screen(name):
+            self.add_widget(self.screen_factories[name](name=name))
+        return self.get_screen(name)
+
+    def on_current(self, instance, value):
+        if value is not None:
+            self.ensure_screen(value)
+            if any(not self.has_screen(name) for name in self.prewarm.get(value, ())):
+                Clock.schedule_once(lambda dt: self.prewarm_after(value), self.PREWARM_DELAY)
+        super().on_current(instance, value)
+
+    def prewarm_after(self, name):
+        # One screen per idle callback keeps each frame's work small
+        for next_name in self.prewarm.get(name, ()):
+            if not self.has_screen(next_name):
+                self.ensure_screen(next_name)
+                return
+
+
+class TextTextureCache:
+    """LRU cache of rendered label textures.
+
+    Keyed by text, font size, text box and colour.  The grid's whole
+    vocabulary (every diameter x item/length) is about 150 strings for each
+    cell size in use, so once warm a screen enter or bin edit never
+    rasterises a font.
+    """
+
+    def __init__(self, capacity=512):
+        self.capacity = capacity
+        self.textures = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text, font_size, text_size, color=(0, 0, 0, 1)):
+        key = (text, font_size, text_size, color)
+        texture = self.textures.get(key)
+        if texture is not None:
+            self.textures.move_to_end(key)
+            self.hits += 1
+            return texture
+        self.misses += 1
+        label = CoreLabel(text=text, font_size=font_size, color=color, halign='center', valign='middle', text_size=text_size)
+        label.refresh()
+        texture = label.texture
+        self.textures[key] = texture
+        if len(self.textures) > self.capacity:
+            self.textures.popitem(last=False)
+        return texture
+
+
+text_textures = TextTextureCache()
+
+
+class GridLines:
+    """All ruling lines of a rows x cols grid as a single Mesh.
+
+    The mesh is built over the unit square and mapped onto the grid's
+    rectangle by a Translate/Scale pair, so moving or resizing the grid
+    only updates two transforms; vertices are rebuilt only when the grid
+    shape changes.  Add .group to a canvas once.
+    """
+
+    def __init__(self, color=(0, 0, 0, 1)):
+        self.group = InstructionGroup()
+        self.translate = Translate(0, 0)
+        self.scale = Scale(1, 1, 1)
+        self.mesh = Mesh(mode='lines')
+        for instruction in (PushMatrix(), self.translate, self.scale, Color(*color), self.mesh, PopMatrix()):
+            self.group.add(instruction)
+        self.shape = None
+
+    def set_shape(self, rows, cols):
+        if self.shape == (rows, cols):
+            return
+        vertices = []
+        for i in range(rows + 1):
+            y = i / rows
+            vertices += [0, y, 0, 0, 1, y, 0, 0]
+        for i in range(cols + 1):
+            x = i / cols
+            vertices += [x, 0, 0, 0, x, 1, 0, 0]
+        self.mesh.vertices = vertices
+        self.mesh.indices = list(range(len(vertices) // 4))
+        self.shape = (rows, cols)
+
+    def place(self, x, y, width, height):
+        self.translate.xy = (x, y)
+        self.scale.xyz = (width, height, 1)
+
+
+class GridTexture:
+    """A BinLayout rendered into an off-screen texture at its on-screen size.
+
+    Each grid screen owns one, sized in pixels to the rectangle it draws it
+    on, so the texture maps 1:1 and cell text stays at its native font size.
+    Rendering the same BinLayout at the same size again is free, and a
+    layout patched by relayout_row() from the one on show only compares the
+    edited row.
+
+    The Fbo, its GridLines and the cell Rectangles are made once and kept:
+    a new size resizes the Fbo and moves the lines and cells, and a new row
+    count adds or drops cells.  Cell textures come from text_textures and
+    are fetched again only when the cells' text box changed size.  A new
+    layout only touches the cells whose text changed, and then the Fbo is
+    drawn once.
+    """
+
+    def __init__(self, font_size=14, text_inset=4, prewarm=None):
+        self.font_size = sp(font_size)
+        self.text_inset = sp(text_inset)
+        self.prewarm_texts = prewarm  # Rasterised once the first layout fixes the text width
+        self.size = None
+        self.shape = None
+        self.cell_width = self.cell_height = 0
+        self.text_size = None
+        self.grid = None  # BinLayout currently rendered
+        self.cells = []  # by row, then column: [text, Rectangle, x, y]
+        self.lines = GridLines()
+        self.cell_group = InstructionGroup()
+        self.fbo = Fbo(size=(1, 1))
+        with self.fbo:
+            ClearColor(1, 1, 1, 1)
+            ClearBuffers()
+            Color(1, 1, 1, 1)
+        self.fbo.add(self.cell_group)
+        self.fbo.add(self.lines.group)
+
+    def render(self, grid, size):
+        """Bring the texture up to date with grid at size (in pixels) and return it."""
+        size = (max(1, int(round(size[0]))), max(1, int(round(size[1]))))
+        if grid is self.grid and size == self.size:
+            return self.fbo.texture
+        rows = None
+        changed = True
+        if (grid.rows, grid.cols) != self.shape:
+            self._reshape(grid.rows, grid.cols)
+            self._resize(size)
+        elif size != self.size:
+            self._resize(size)
+        else:
+            # After a one-row edit only that row needs comparing
+            rows = grid.changed_rows(self.grid)
+            changed = False
+        for row in range(grid.rows) if rows is None else rows:
+            for cell, layout_cell in zip(self.cells[row], grid.cells[row]):
+                if cell[0] != layout_cell.text:
+                    self._set_text(cell, layout_cell.text)
+                    changed = True
+        if changed:
+            # The Fbo isn't part of any widget canvas, so draw it here
+            self.fbo.draw()
+        self.grid = grid
+        return self.fbo.texture
+
+    def prewarm(self, texts, batch=16):
+        """Rasterise texts into text_textures at the current text width, a batch per frame."""
+        texts = list(texts)
+        text_size = self.text_size
+
+        def step(dt):
+            for text in texts[:batch]:
+                text_textures.get(text, self.font_size, text_size)
+            del texts[:batch]
+            return bool(texts)  # False unschedules once everything is cached
+
+        Clock.schedule_interval(step, 0)
+
+    def _reshape(self, rows, cols):
+        self.shape = (rows, cols)
+        self.lines.set_shape(rows, cols)
+        # Keep the Rectangles already in the Fbo; add or drop only the difference
+        pool = [cell for row_cells in self.cells for cell in row_cells]
+        for cell in pool[rows * cols:]:
+            self.cell_group.remove(cell[1])
+        del pool[rows * cols:]
+        while len(pool) < rows * cols:
+            rect = Rectangle(size=(0, 0))
+            self.cell_group.add(rect)
+            pool.append(['', rect, 0, 0])
+        self.cells = [pool[row * cols:(row + 1) * cols] for row in range(rows)]
+
+    def _resize(self, size):
+        rows, cols = self.shape
+        width, height = size
+        self.size = size
+        self.fbo.size = size
+        self.cell_width = width / cols
+        self.cell_height = height / rows
+        # Inset by half a pixel so the outer border isn't clipped off the texture
+        self.lines.place(0.5, 0.5, width - 1, height - 1)
+        # Text box inside the cell, as the per-cell Labels used to have
+        previous, self.text_size = self.text_size, (max(1, int(self.cell_width - self.text_inset)),
+                                                    max(1, int(self.cell_height - self.text_inset)))
+        if self.prewarm_texts is not None and self.text_size != previous:
+            self.prewarm(self.prewarm_texts)
+        for row, row_cells in enumerate(self.cells):
+            for col, cell in enumerate(row_cells):
+                cell[2], cell[3] = col * self.cell_width, (rows - 1 - row) * self.cell_height
+                if self.text_size != previous:
+                    self._set_text(cell, cell[0])
+                elif cell[0]:
+                    self._centre(cell)
+
+    def _set_text(self, cell, text):
+        cell[0] = text
+        rect = cell[1]
+        if not text:
+            rect.size = (0, 0)
+            return
+        rect.texture = text_textures.get(text, self.font_size, self.text_size)
+        self._centre(cell)
+
+    def _centre(self, cell):
+        rect, x, y = cell[1:]
+        rect.size = rect.texture.size
+        rect.pos = (x + (self.cell_width - rect.texture.width) / 2, y + (self.cell_height - rect.texture.height) / 2)
@@ -0,0 +1,114 @@
+"""Soak check: visit every screen of the Kivy app many times.
+
+    python screen_soak.py [visits] [--reset]
+
+Cycles through all screens (1000 visits each by default) with a small
+bin loaded, then checks that the number of canvas instructions and the
+traced Python memory are the same after the last round as after the
+first.  Exits non-zero if either grew, so a screen that appends to its
+canvas or leaks widgets on every visit shows up before a long shift does.
+Each switch waits for the previous screen's on_enter, so every visit is
+one real entry through the ScreenManager, as a tap makes it.
+With --reset every round ends in a kiosk session reset, as the Done
+button does, so the same check covers thousands of customer sessions.
+test_screen_soak.py runs a shorter soak under pytest.
+"""
+import gc
+import sys
+import tracemalloc
+
+from kivy.clock import Clock
+from kivy.uix.screenmanager import NoTransition
+
+from bin_generator_6 import BoltBinApp
+
+# Ends on start, the screen the app opens on and Done returns to, so every
+# switch in a round is a real change of screen
+SCREENS = ['bin_size', 'material', 'bin_config', 'add_diameter', 'add_length', 'summary', 'start']
+MEMORY_SLACK = 512 * 1024  # bytes of growth tolerated for allocator noise
+
+
+def count_instructions(instruction):
+    """Instructions under instruction, including canvas.before/after."""
+    count = 1
+    for child in getattr(instruction, 'children', ()):
+        count += count_instructions(child)
+    for extra in ('before', 'after'):
+        if getattr(instruction, 'has_' + extra, False):
+            count += count_instructions(getattr(instruction, extra))
+    return count
+
+
+class SoakApp(BoltBinApp):
+    def __init__(self, visits, reset=False, **kwargs):
+        super().__init__(**kwargs)
+        self.visits = visits
+        self.reset = reset
+        self.round = 0
+        self.position = 0
+        self.entries = dict.fromkeys(SCREENS, 0)
+        self.baseline = None
+        self.failed = False
+
+    def on_start(self):
+        self.root.transition = NoTransition()
+        self.seed()
+        tracemalloc.start()
+        for name in SCREENS:
+            self.root.ensure_screen(name).bind(on_enter=self.entered)
+        self.root.current = SCREENS[0]
+
+    def seed(self):
+        self.bin_size = '56'
+        self.max_rows = 7
+        self.selected_diameter = '3/8'
+        self.history.apply('3/8', ['Nut', '1', '1-1/2'])
+        self.mark_bin_changed()
+
+    def measure(self):
+        gc.collect()
+        instructions = sum(count_instructions(screen.canvas) for screen in self.root.screens)
+        return instructions, tracemalloc.get_traced_memory()[0]
+
+    def entered(self, screen):
+        self.entries[screen.name] += 1
+        # Switching again before the transition completes would skip
+        # on_enter, so the next visit starts on a later frame
+        Clock.schedule_once(self.step)
+
+    def step(self, dt):
+        if self.position < len(SCREENS) - 1:
+            self.position += 1
+        elif self.end_round():
+            self.position = 0
+        else:
+            return
+        self.root.current = SCREENS[self.position]
+
+    def end_round(self):
+        """Measure after a round of visits; returns False once the soak is over."""
+        if self.reset:
+            self.reset_session()
+            self.seed()
+        self.round += 1
+        if self.round == 1:
+            self.baseline = self.measure()
+        elif self.round >= self.visits:
+            instructions, memory = self.measure()
+            print(f"instructions: {self.baseline[0]} -> {instructions}")
+            print(f"traced memory: {self.baseline[1]} -> {memory} bytes")
+            print(f"entries per screen: {min(self.entries.values())}-{max(self.entries.values())} in {self.round} rounds")
+            if self.reset:
+                print(f"sessions: {self.session_count}")
+            self.failed = instructions != self.baseline[0] or memory - self.baseline[1] > MEMORY_SLACK
+            print("FAIL" if self.failed else "OK")
+            self.stop()
+            return False
+        return True
+
+
+if __name__ == '__main__':
+    args = [arg for arg in sys.argv[1:] if arg != '--reset']
+    app = SoakApp(int(args[0]) if args else 1000, reset='--reset' in sys.argv[1:])
+    app.run()
+    sys.exit(1 if app.failed else 0)
@@ -0,0 +1,78 @@
+import os
+import time
+
+import pytest
+
+from bin_cache import ExportCache, export_key
+
+
+def age(path, seconds):
+    """Back-date path's mtime, the recency eviction goes by."""
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+def test_export_key_is_canonical():
+    assert export_key('pdf', ('1/4', ('Nut',))) == export_key('pdf', ['1/4', ['Nut']])
+    assert export_key('pdf', 'a') != export_key('docx', 'a')
+
+
+def test_fetch_builds_once_then_hits(tmp_path):
+    cache = ExportCache(str(tmp_path))
+    builds = []
+
+    def build(path):
+        builds.append(path)
+        with open(path, 'wb') as f:
+            f.write(b'pdf')
+
+    path = cache.fetch('k', '.pdf', build)
+    age(path, 3600)
+    assert cache.fetch('k', '.pdf', build) == path
+    assert len(builds) == 1
+    assert os.path.getmtime(path) > time.time() - 60  # The hit refreshed it
+    assert cache.get('other', '.pdf') is None
+
+
+def test_put_stores_bytes(tmp_path):
+    cache = ExportCache(str(tmp_path))
+    path = cache.put('k', '.docx', b'docx bytes')
+    assert path == cache.path('k', '.docx')
+    with open(path, 'rb') as f:
+        assert f.read() == b'docx bytes'
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ExportCache(str(tmp_path), max_bytes=250)
+    a = cache.put('a', '.pdf', b'a' * 100)
+    b = cache.put('b', '.pdf', b'b' * 100)
+    age(a, 300)
+    age(b, 200)
+    assert cache.get('a', '.pdf') == a  # Used again: now b is the oldest
+    c = cache.put('c', '.pdf', b'c' * 100)
+    assert sorted(os.listdir(tmp_path)) == ['a.pdf', 'c.pdf']
+    assert os.path.exists(a) and os.path.exists(c) and not os.path.exists(b)
+
+
+def test_keeps_new_entry_larger_than_limit(tmp_path):
+    cache = ExportCache(str(tmp_path), max_bytes=50)
+    small = cache.put('small', '.pdf', b's' * 40)
+    age(small, 300)
+    big = cache.put('big', '.pdf', b'b' * 100)
+    age(big, 600)  # Older than anything else, yet it was just stored
+    cache.evict(keep=big)
+    assert os.listdir(tmp_path) == ['big.pdf']
+
+
+def test_failed_build_leaves_nothing_behind(tmp_path):
+    cache = ExportCache(str(tmp_path))
+
+    def build(path):
+        with open(path, 'wb') as f:
+            f.write(b'half a pdf')
+        raise RuntimeError("renderer crashed")
+
+    with pytest.raises(RuntimeError):
+        cache.fetch('k', '.pdf', build)
+    assert os.listdir(tmp_path) == []
+    assert cache.get('k', '.pdf') is None
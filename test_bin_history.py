@@ -0,0 +1,83 @@
+from bin_history import BinHistory
+
+
+def snapshot(history):
+    return [(row.diameter, row.values()) for row in history.rows]
+
+
+def test_apply_undo_redo_round_trip():
+    history = BinHistory()
+    history.apply('1/4', ['Nut', '1/2'])
+    history.apply('1/4', ['3/4'])
+    history.apply('3/8', ['1'])
+    after = snapshot(history)
+
+    while history.undo():
+        pass
+    assert history.rows == []
+    assert history.positions == {}
+
+    while history.redo():
+        pass
+    assert snapshot(history) == after
+    assert history.positions == {'1/4': 0, '3/8': 1}
+
+
+def test_undo_created_row_after_later_edits_to_other_rows():
+    history = BinHistory()
+    history.apply('1/4', ['Nut'])
+    history.apply('3/8', ['1'])  # Creates the last row
+    history.apply('1/4', ['1/2'])  # Later edit to an earlier row
+
+    edit = history.undo()
+    assert (edit.diameter, edit.created) == ('1/4', False)
+    assert snapshot(history) == [('1/4', ['Nut']), ('3/8', ['1'])]
+
+    edit = history.undo()
+    assert (edit.diameter, edit.created) == ('3/8', True)
+    assert snapshot(history) == [('1/4', ['Nut'])]
+    assert '3/8' not in history.positions
+
+    history.redo()
+    history.redo()
+    assert snapshot(history) == [('1/4', ['Nut', '1/2']), ('3/8', ['1'])]
+
+
+def test_apply_clears_redo_stack():
+    history = BinHistory()
+    history.apply('1/4', ['Nut'])
+    history.apply('1/4', ['1/2'])
+    history.undo()
+    assert history.redo_stack
+
+    history.apply('1/4', ['3/4'])
+    assert not history.redo_stack
+    assert history.redo() is None
+    assert snapshot(history) == [('1/4', ['Nut', '3/4'])]
+
+
+def test_empty_confirm_on_existing_row_returns_none():
+    history = BinHistory()
+    history.apply('1/4', ['Nut'])
+    depth = len(history.undo_stack)
+
+    assert history.apply('1/4', []) is None
+    assert history.apply('1/4', ['Nut']) is None  # Already selected
+    assert len(history.undo_stack) == depth
+
+
+def test_empty_confirm_creates_row():
+    history = BinHistory()
+    edit = history.apply('1/4', [])
+    assert edit.created and edit.bits == 0
+    history.undo()
+    assert history.rows == []
+
+
+def test_history_shares_rows_list():
+    rows = []
+    history = BinHistory(rows)
+    history.apply('5/16', ['Nut'])
+    assert rows is history.rows and len(rows) == 1
+    history.clear()
+    assert rows == [] and not history.undo_stack
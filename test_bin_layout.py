@@ -0,0 +1,179 @@
+from fractions import Fraction
+
+import pytest
+
+from bin_catalog import Config
+from bin_history import BinHistory
+from bin_layout import NUM_COLS, layout_bin_data, layout_bolts, relayout_row
+from bin_rows import BinRow
+from bin_sizes import format_size, parse_size
+
+
+# The inline loops the front ends ran before bin_layout, reduced to the
+# (row, col, text) positions they drew
+
+def convert_to_decimal(length_str):
+    if '-' in length_str:
+        whole, frac = length_str.split('-')
+        whole = int(whole) if whole else 0
+        num, denom = map(int, frac.split('/'))
+        return whole + num / denom
+    elif '/' in length_str:
+        num, denom = map(int, length_str.split('/'))
+        return num / denom
+    else:
+        return float(length_str)
+
+
+def kivy_baseline(bin_data, max_rows, num_cols=8):
+    drawn = set()
+    for row in range(max_rows):
+        for col in range(num_cols):
+            if row < len(bin_data):
+                entry = bin_data[row]
+                diameter = entry['diameter']
+                items = sorted([item for item in entry['items'] if item in Config.ITEM_OPTIONS])
+                lengths = sorted(entry['lengths'], key=convert_to_decimal)
+                selected_items = items + lengths
+                size_text = f"{diameter} x {selected_items[col]}" if col < len(selected_items) else ""
+            else:
+                size_text = ""
+            if size_text:
+                drawn.add((row, col, size_text))
+    return drawn
+
+
+def tk_baseline(bolts, rows, max_items, max_lengths):
+    drawn = set()
+    for i, (size, lengths, items) in enumerate(bolts[:rows], 0):
+        item_list = [item for item in ["Nut", "Flatwasher", "Lockwasher", "Locknut", "Blank"] if item in items]
+        for j, item in enumerate(item_list[:max_items]):
+            if item != "Blank":
+                item_char = {"Nut": "N", "Flatwasher": "F", "Lockwasher": "L", "Locknut": "LN"}[item]
+                drawn.add((i, j, item_char))
+        start_col = len(item_list)
+        for j, length in enumerate(lengths[:max_lengths]):
+            drawn.add((i, j + start_col, format_size(length)))
+    return drawn
+
+
+def drawn(layout):
+    return {(row, col, cell.text) for row, col, cell in layout}
+
+
+def kivy_rows(entries):
+    return [BinRow.from_dict(entry) for entry in entries]
+
+
+def bolt(size, lengths, items):
+    return (parse_size(size), [parse_size(length) for length in lengths], set(items))
+
+
+def test_kivy_rows_match_baseline():
+    entries = [
+        {'diameter': '1/4', 'items': ['Nut', 'Flatwasher'], 'lengths': ['1', '3/8', '1-1/2']},
+        {'diameter': '1', 'items': [], 'lengths': ['10-1/2', '2', '9-1/2']},
+        {'diameter': '3/8', 'items': ['Nylon Locknut'], 'lengths': []},
+    ]
+    layout = layout_bin_data(kivy_rows(entries), 7)
+    assert drawn(layout) == kivy_baseline(entries, 7)
+    assert layout.cells[0][1].text == '1/4 x Nut'
+    assert [cell.kind for cell in layout.cells[0][:3]] == ['item', 'item', 'length']
+    assert layout.cells[3] == layout.cells[6]  # Rows without an entry stay empty
+
+
+def test_kivy_row_truncated_at_num_cols():
+    lengths = Config.AVAILABLE_LENGTHS['5/16'][:10]
+    entries = [{'diameter': '5/16', 'items': ['Nut', 'Lockwasher'], 'lengths': lengths}]
+    layout = layout_bin_data(kivy_rows(entries), 7)
+    assert drawn(layout) == kivy_baseline(entries, 7)
+    assert len(layout.cells[0]) == NUM_COLS
+    assert layout.cells[0][-1].text == f"5/16 x {lengths[NUM_COLS - 3]}"
+    # Reports still list every value
+    assert len(layout.entries[0][1]) == 12
+
+
+def test_kivy_rows_beyond_max_rows():
+    entries = [{'diameter': diameter, 'items': ['Nut'], 'lengths': []} for diameter in Config.DIAMETERS]
+    layout = layout_bin_data(kivy_rows(entries), 7)
+    assert drawn(layout) == kivy_baseline(entries, 7)
+    assert layout.rows == len(layout.cells) == 7
+    assert [label for label, _ in layout.entries] == Config.DIAMETERS
+    assert layout.label(8) == '1'
+
+
+def test_relayout_row_matches_full_layout():
+    history = BinHistory()
+    layout = layout_bin_data(history.rows, 7)
+    steps = [
+        lambda: history.apply('1/4', ['Nut', '1']),
+        lambda: history.apply('3/8', ['2']),
+        lambda: history.apply('1/4', ['1-1/2']),
+        history.undo, history.undo, history.redo, history.undo, history.undo, history.redo,
+    ]
+    for step in steps:
+        edit = step()
+        patched = relayout_row(layout, history.rows, edit.position)
+        full = layout_bin_data(history.rows, 7)
+        assert (patched.cells, patched.entries) == (full.cells, full.entries)
+        assert patched.changed_rows(layout) == (edit.position,)
+        assert full.changed_rows(layout) is None
+        layout = patched
+
+
+def test_relayout_row_beyond_max_rows():
+    history = BinHistory()
+    for diameter in Config.DIAMETERS[:3]:
+        history.apply(diameter, ['Nut'])
+    layout = layout_bin_data(history.rows, 2)
+    edit = history.apply('3/8', ['1'])
+    patched = relayout_row(layout, history.rows, edit.position)
+    assert patched.cells == layout.cells
+    assert patched.entries == layout_bin_data(history.rows, 2).entries
+    assert patched.changed_rows(layout) == ()
+
+
+def test_tk_blank_columns():
+    bolts = [
+        bolt('3/8', ['1', '1-1/2'], {'Nut', 'Blank'}),
+        bolt('1/2', ['2'], {'Blank', 'Flatwasher', 'Lockwasher'}),
+    ]
+    layout = layout_bolts(bolts, 7, 4, 4, format_size)
+    assert drawn(layout) == tk_baseline(bolts, 7, 4, 4)
+    assert layout.cells[0][1].kind == 'blank'
+    assert layout.cells[0][2].text == '1'
+    assert [cell.kind for cell in layout.cells[1][:4]] == ['item', 'item', 'blank', 'length']
+
+
+def test_tk_lengths_start_after_hidden_items():
+    # Three items but two item columns: the third isn't drawn, yet lengths
+    # still start after it, and the last one falls off the grid
+    bolts = [bolt('1/4', ['1/2', '3/4', '1', '2'], {'Nut', 'Flatwasher', 'Lockwasher'})]
+    layout = layout_bolts(bolts, 7, 2, 4, format_size)
+    baseline = tk_baseline(bolts, 7, 2, 4)
+    assert drawn(layout) == {(row, col, text) for row, col, text in baseline if col < layout.cols}
+    assert (0, 6, '2') in baseline and layout.cols == 6
+    assert layout.cells[0][2].kind == 'empty'
+    assert layout.cells[0][3].text == '1/2'
+
+
+def test_tk_lengths_truncated_at_max_lengths():
+    bolts = [bolt('1/4', ['1/2', '3/4', '1', '2', '3'], {'Nut'})]
+    layout = layout_bolts(bolts, 7, 4, 4, format_size)
+    assert drawn(layout) == tk_baseline(bolts, 7, 4, 4)
+    assert layout.entries[0] == ('1/4', ('Nut', '1/2', '3/4', '1', '2', '3'))
+
+
+def test_tk_rows_beyond_max_rows():
+    bolts = [bolt(size, ['1'], {'Nut'}) for size in ['1/4', '5/16', '3/8', '7/16', '1/2', '5/8', '3/4', '7/8']]
+    layout = layout_bolts(bolts, 7, 4, 4, format_size)
+    assert drawn(layout) == tk_baseline(bolts, 7, 4, 4)
+    assert len(layout.cells) == 7
+    assert len(layout.entries) == 8
+    assert layout.label(7) == '7/8'
+
+
+@pytest.mark.parametrize('size, text', [(Fraction(3, 2), '1-1/2'), (Fraction(5, 16), '5/16')])
+def test_tk_lengths_use_format_number(size, text):
+    layout = layout_bolts([(Fraction(1, 2), [size], set())], 7, 4, 4, format_size)
+    assert layout.cells[0][0].text == text
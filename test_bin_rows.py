@@ -0,0 +1,61 @@
+import pytest
+
+from bin_catalog import Config
+from bin_rows import BITS, ITEM_MASK, SLOTS, BinRow
+
+
+def test_bits_follow_display_order():
+    for diameter in Config.DIAMETERS:
+        slots = SLOTS[diameter]
+        assert slots[:4] == tuple(sorted(Config.ITEM_OPTIONS))
+        assert slots[4:] == tuple(Config.AVAILABLE_LENGTHS[diameter])
+        assert [BITS[diameter][value] for value in slots] == [1 << i for i in range(len(slots))]
+        assert len(slots) <= 16
+
+
+def test_values_are_sorted_whatever_the_selection_order():
+    row = BinRow('1/4')
+    row.add_all(['1-1/2', 'Nut', '3/8', 'Flatwasher'])
+    assert row.values() == ['Flatwasher', 'Nut', '3/8', '1-1/2']
+    assert row.items == ['Flatwasher', 'Nut']
+    assert row.lengths == ['3/8', '1-1/2']
+    assert list(row) == row.values()
+    assert len(row) == 4
+
+
+def test_add_all_returns_only_new_bits():
+    row = BinRow('3/8')
+    first = row.add_all(['Nut', '1'])
+    assert first == BITS['3/8']['Nut'] | BITS['3/8']['1']
+    again = row.add_all(['1', '2', 'Nut'])
+    assert again == BITS['3/8']['2']
+    assert row.values(again) == ['2']
+    assert row.add_all(['2']) == 0
+
+
+def test_clear_bits_undoes_add_all():
+    row = BinRow('1/2', BITS['1/2']['Nut'])
+    bits = row.add_all(['Nut', '1', '6'])
+    row.clear_bits(bits)
+    assert row.values() == ['Nut']
+
+
+def test_values_mask_restricts_to_selection():
+    row = BinRow('5/8')
+    row.add_all(['Lockwasher', '3'])
+    assert row.values(ITEM_MASK) == ['Lockwasher']
+    assert row.values(BITS['5/8']['4']) == []
+
+
+def test_from_dict_and_membership():
+    row = BinRow.from_dict({'diameter': '1', 'items': ['Nylon Locknut'], 'lengths': ['10-1/2', '2']})
+    assert row == BinRow('1', BITS['1']['Nylon Locknut'] | BITS['1']['2'] | BITS['1']['10-1/2'])
+    assert '2' in row and '3' not in row and 'bogus' not in row
+    assert not BinRow('1')
+
+
+def test_rejects_values_not_offered():
+    with pytest.raises(ValueError):
+        BinRow('1/4').add_all(['10-1/2'])
+    with pytest.raises(ValueError):
+        BinRow('2')
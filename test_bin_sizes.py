@@ -0,0 +1,50 @@
+from fractions import Fraction
+
+import pytest
+
+from bin_sizes import Size, format_size, parse_size
+
+
+@pytest.mark.parametrize('text, value', [
+    ('3/8', Fraction(3, 8)),
+    ('1-1/2', Fraction(3, 2)),
+    ('2', Fraction(2)),
+    (' 5/16 ', Fraction(5, 16)),
+    ('1.5', Fraction(3, 2)),
+    ('10-3/4', Fraction(43, 4)),
+])
+def test_parse_size(text, value):
+    assert parse_size(text) == value
+
+
+@pytest.mark.parametrize('text', ['', 'abc', '1/0', '1-3', '1-1.5', '1-3/2', '1-0/4', '1-1/2/3', '1-2-1/2'])
+def test_parse_size_rejects(text):
+    assert parse_size(text) is None
+
+
+def test_parse_size_interns_catalogue_sizes():
+    assert parse_size('3/8') is parse_size('3/8')
+    assert parse_size('1-2/4') is parse_size('1-1/2')
+
+
+@pytest.mark.parametrize('value, text', [
+    (Fraction(3, 8), '3/8'),
+    (1.5, '1-1/2'),
+    (2, '2'),
+    (Fraction(5, 16), '5/16'),
+    (Fraction(65, 32), '2-1/32'),
+])
+def test_format_size(value, text):
+    assert format_size(value) == text
+
+
+def test_round_trip():
+    for text in ['1/4', '5/16', '1-1/4', '3', '7-7/8']:
+        assert format_size(parse_size(text)) == text
+
+
+def test_size_compares_exactly():
+    assert Size(Fraction(1, 3)) == Fraction(1, 3)
+    assert Size(Fraction(1, 4)) < Size(Fraction(5, 16)) < 1
+    assert hash(parse_size('1/2')) == hash(Fraction(1, 2))
+    assert sorted([parse_size('1'), parse_size('3/8'), parse_size('1/2')]) == [Fraction(3, 8), Fraction(1, 2), 1]
@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+# Before Kivy is imported: no window server needed, and pytest's own
+# arguments aren't Kivy's
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'offscreen')
+pytest.importorskip('kivy')
+
+from screen_soak import SoakApp  # noqa: E402
+
+
+def test_screen_visits_stay_flat():
+    # A Kivy App runs once per process, so this is the only soak; it ends
+    # every round in a session reset to cover Done as well
+    app = SoakApp(30, reset=True)
+    app.run()
+    assert not app.failed
+    assert set(app.entries.values()) == {app.visits}  # One real entry per visit
+    assert app.session_count == app.visits
@@ -1,12 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, Canvas
 import re
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
 import os
-import tempfile
 import platform
-import subprocess
+from bin_layout import layout_bolts, max_rows_for
+from bin_sizes import format_size, parse_size
+from bin_tk import TkBinGrid, TkExporter, sheet_layout
+import bin_pdf
+from bin_imports import preload
 from datetime import datetime
 
 class BoltBinApp:
@@ -19,28 +20,43 @@ class BoltBinApp:
         self.max_lengths = 4
         self.max_items = 4
         self.current_screen = None
+        self.screens = {}  # name -> Frame, built on first visit
+        self.root.rowconfigure(0, weight=1)
+        self.root.columnconfigure(0, weight=1)
         self.bin_size = tk.StringVar(value="56")
         self.material = tk.StringVar(value="Grade 5 Zinc")
         self.pdf_dir = "/home/pi/bolt_bin_pdfs"  # Default PDF save directory
         os.makedirs(self.pdf_dir, exist_ok=True)  # Create directory if it doesn't exist
+        # Export progress shows in the info label
+        self.exporter = TkExporter(self.root, self.refresh_info_label, parent=lambda: self.current_screen)
         self.setup_bin_size_screen()
-
-    def clear_screen(self):
-        """Clear the current screen."""
-        if self.current_screen:
-            self.current_screen.destroy()
-        self.current_screen = tk.Frame(self.root)
-        self.current_screen.pack(fill="both", expand=True)
+        # Load reportlab in the background once the window is up, so the
+        # first save or print doesn't stall on it
+        self.root.after(1000, preload, bin_pdf.pagesizes, bin_pdf.canvas)
+
+    def show_screen(self, name, build):
+        """Raise the named screen, building its frame the first time."""
+        frame = self.screens.get(name)
+        if frame is None:
+            # Every screen shares the root's single grid cell; tkraise picks the visible one
+            frame = tk.Frame(self.root)
+            frame.grid(row=0, column=0, sticky="nsew")
+            build(frame)
+            self.screens[name] = frame
+        frame.tkraise()
+        self.current_screen = frame
 
     def setup_bin_size_screen(self):
         """Screen 1: Choose bin size (56 or 72 holes)."""
-        self.clear_screen()
-        tk.Label(self.current_screen, text="Select Bin Size", font=("Helvetica", 24, "bold")).pack(pady=20)
-        tk.Button(self.current_screen, text="56 Holes", font=("Helvetica", 20), bg="#4CAF50", fg="white",
+        self.show_screen("bin_size", self.build_bin_size_screen)
+
+    def build_bin_size_screen(self, frame):
+        tk.Label(frame, text="Select Bin Size", font=("Helvetica", 24, "bold")).pack(pady=20)
+        tk.Button(frame, text="56 Holes", font=("Helvetica", 20), bg="#4CAF50", fg="white",
                  width=15, height=3, command=lambda: self.set_bin_size("56")).pack(pady=20)
-        tk.Button(self.current_screen, text="72 Holes", font=("Helvetica", 20), bg="#4CAF50", fg="white",
+        tk.Button(frame, text="72 Holes", font=("Helvetica", 20), bg="#4CAF50", fg="white",
                  width=15, height=3, command=lambda: self.set_bin_size("72")).pack(pady=20)
-        tk.Button(self.current_screen, text="Exit", font=("Helvetica", 16), bg="#F44336", fg="white",
+        tk.Button(frame, text="Exit", font=("Helvetica", 16), bg="#F44336", fg="white",
                  width=10, height=2, command=self.root.quit).pack(pady=20)
 
     def set_bin_size(self, size):
@@ -51,13 +67,15 @@ class BoltBinApp:
 
     def setup_material_screen(self):
         """Screen 2: Choose material."""
-        self.clear_screen()
-        tk.Label(self.current_screen, text="Select Material", font=("Helvetica", 24, "bold")).pack(pady=20)
+        self.show_screen("material", self.build_material_screen)
+
+    def build_material_screen(self, frame):
+        tk.Label(frame, text="Select Material", font=("Helvetica", 24, "bold")).pack(pady=20)
         materials = ["Grade 5 Zinc", "Grade 5 Plain", "Grade 8 Plain", "Grade 8 Yellow Zinc", "304 Stainless Steel"]
         for mat in materials:
-            tk.Button(self.current_screen, text=mat, font=("Helvetica", 16), bg="#2196F3", fg="white",
+            tk.Button(frame, text=mat, font=("Helvetica", 16), bg="#2196F3", fg="white",
                      width=25, height=2, command=lambda m=mat: self.set_material(m)).pack(pady=10)
-        tk.Button(self.current_screen, text="Back", font=("Helvetica", 16), bg="#F44336", fg="white",
+        tk.Button(frame, text="Back", font=("Helvetica", 16), bg="#F44336", fg="white",
                  width=10, height=2, command=self.setup_bin_size_screen).pack(pady=20)
 
     def set_material(self, material):
@@ -68,14 +86,20 @@ class BoltBinApp:
 
     def setup_main_screen(self):
         """Screen 3: Main interface for adding bolts and previewing."""
-        self.clear_screen()
-        main_frame = self.current_screen
+        self.show_screen("main", self.build_main_screen)
+        # The frame is reused, so refresh what depends on the earlier choices
+        self.refresh_info_label()
+        self.size_var.set("")
+        self.length_var.set("")
+        self.update_grid()
+
+    def build_main_screen(self, main_frame):
         main_frame.columnconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
 
         # Bin and material display
-        tk.Label(main_frame, text=f"Bin: {self.bin_size.get()} Holes | Material: {self.material.get()}",
-                 font=("Helvetica", 14)).grid(row=0, column=0, columnspan=2, pady=10)
+        self.info_label = tk.Label(main_frame, font=("Helvetica", 14))
+        self.info_label.grid(row=0, column=0, columnspan=2, pady=10)
 
         # Bolt size selection (buttons)
         tk.Label(main_frame, text="Bolt Size:", font=("Helvetica", 16)).grid(row=1, column=0, padx=10, pady=10, sticky="e")
@@ -118,7 +142,8 @@ class BoltBinApp:
         # Canvas for grid preview
         self.canvas = Canvas(main_frame, width=600, height=200, bg="white")
         self.canvas.grid(row=5, column=0, columnspan=2, padx=10, pady=10)
-        self.update_grid()
+        self.grid_view = TkBinGrid(self.canvas, 600, 200, cell_width=60, cell_height=25, label_offset=30,
+                                   font=("Helvetica", 12), header_font=("Helvetica", 10))
 
         # Navigation buttons
         tk.Button(main_frame, text="Back", font=("Helvetica", 16), bg="#F44336", fg="white",
@@ -127,20 +152,8 @@ class BoltBinApp:
                  width=10, height=2, command=self.root.quit).grid(row=6, column=1, pady=10)
 
     def parse_fraction(self, text):
-        """Convert fraction like 1-1/2 to decimal."""
-        text = text.strip()
-        try:
-            if "-" in text:
-                whole, frac = text.split("-")
-                num, denom = frac.split("/")
-                return float(whole or 0) + float(num) / float(denom)
-            elif "/" in text:
-                num, denom = text.split("/")
-                return float(num) / float(denom)
-            else:
-                return float(text)
-        except (ValueError, ZeroDivisionError):
-            return None
+        """Convert fraction like 1-1/2 to an exact Size."""
+        return parse_size(text)
 
     def show_item_popup(self, size):
         """Show a pop-up to select items for a new size."""
@@ -194,7 +207,7 @@ class BoltBinApp:
             return
 
         for bolt in self.bolts:
-            if abs(bolt[0] - size_val) < 0.001:
+            if bolt[0] == size_val:
                 row_capacity = self.max_items + self.max_lengths
                 if len(bolt[2]) + len(bolt[1]) + 1 > row_capacity:
                     messagebox.showerror("Error", f"Cannot add more items or lengths for size {size}. Row capacity ({row_capacity}) reached.", parent=self.current_screen)
@@ -226,7 +239,7 @@ class BoltBinApp:
             return
 
         for bolt in self.bolts:
-            if abs(bolt[0] - size_val) < 0.001:
+            if bolt[0] == size_val:
                 row_capacity = self.max_items + self.max_lengths
                 if len(bolt[2]) + len(bolt[1]) + 1 > row_capacity:
                     messagebox.showerror("Error", f"Cannot add more items or lengths (including blanks) for size {size}. Row capacity ({row_capacity}) reached.", parent=self.current_screen)
@@ -264,81 +277,33 @@ class BoltBinApp:
     def clear_all(self):
         """Clear all bolts and items."""
         self.bolts = []
-        self.canvas.delete("all")
         self.update_grid()
         messagebox.showinfo("Success", "All items cleared.", source=self.current_screen)
 
     def format_number(self, num):
-        """Convert decimal to fraction if needed."""
-        if num.is_integer():
-            return str(int(num))
-        whole = int(num)
-        frac = num - whole
-        for denom in range(2, 8):
-            num_frac = round(frac * denom)
-            if abs(frac * denom - num_frac) < 0.001:
-                if whole == 0:
-                    return f"{num_frac}/{denom}"
-                return f"{whole}-{num_frac}/{denom}"
-        return f"{num:.2f}"
+        """Convert a size to fraction text like 1-1/2."""
+        return format_size(num)
 
     def update_grid(self):
         """Update the canvas grid preview."""
-        self.canvas.delete("all")
         bin_slots = int(self.bin_size.get())
-        max_rows = 7 if bin_slots == 56 else 9
+        max_rows = max_rows_for(bin_slots)
         rows = max_rows if not self.bolts else min(len(self.bolts), max_rows)
-        cols = self.max_items + self.max_lengths
-        cell_width = 60
-        cell_height = 25
-        grid_width = cols * cell_width
-        grid_height = rows * cell_height
-        offset_x = (600 - grid_width) / 2
-        offset_y = (200 - grid_height) / 2
-
-        # Draw grid
-        for i in range(rows + 1):
-            y = offset_y + i * cell_height
-            self.canvas.create_line(offset_x, y, offset_x + cols * cell_width, y, fill="black")
-        for j in range(cols + 1):
-            x = offset_x + j * cell_width
-            self.canvas.create_line(x, offset_y, x, offset_y + rows * cell_height, fill="black")
+        layout = layout_bolts(self.bolts, rows, self.max_items, self.max_lengths, self.format_number)
 
         # Label rows with sizes or placeholders
-        for i in range(rows):
-            if i < len(self.bolts):
-                size = self.bolts[i][0]
-                size_str = self.format_number(size)
-            else:
-                size_str = f"Row {i+1}"
-            self.canvas.create_text(offset_x - 30, offset_y + i * cell_height + cell_height / 2,
-                                   text=size_str, anchor="e", font=("Helvetica", 12), fill="black")
-
-        # Draw item and length cells
-        for i, (size, lengths, items) in enumerate(self.bolts[:rows], 0):
-            item_list = [item for item in ["Nut", "Flatwasher", "Lockwasher", "Locknut", "Blank"] if item in items]
-            for j, item in enumerate(item_list[:self.max_items]):
-                if item != "Blank":
-                    item_char = {"Nut": "N", "Flatwasher": "F", "Lockwasher": "L", "Locknut": "LN"}[item]
-                    self.canvas.create_text(offset_x + j * cell_width + cell_width / 2,
-                                           offset_y + i * cell_height + cell_height / 2,
-                                           text=item_char, anchor="center", font=("Helvetica", 12), fill="black")
-            start_col = len(item_list)
-            for j, length in enumerate(lengths[:self.max_lengths]):
-                length_str = self.format_number(length)
-                self.canvas.create_text(offset_x + (j + start_col) * cell_width + cell_width / 2,
-                                       offset_y + i * cell_height + cell_height / 2,
-                                       text=length_str, anchor="center", font=("Helvetica", 12), fill="black")
-
-        # Add column headers
+        row_labels = [layout.label(i) or f"Row {i+1}" for i in range(rows)]
+        # Column headers: item initials, then length slots
         item_labels = ["Nut", "Flatwasher", "Lockwasher", "Locknut"]
-        for j in range(self.max_items):
-            self.canvas.create_text(offset_x + j * cell_width + cell_width / 2,
-                                   offset_y - 10, text=item_labels[j][0], anchor="center", font=("Helvetica", 10))
-        for j in range(self.max_lengths):
-            self.canvas.create_text(offset_x + (j + self.max_items) * cell_width + cell_width / 2,
-                                   offset_y - 10, text=f"Len {j+1}", anchor="center", font=("Helvetica", 10))
-"""
+        headers = [item_labels[j][0] for j in range(self.max_items)] + [f"Len {j+1}" for j in range(self.max_lengths)]
+        self.grid_view.update(layout, row_labels, headers, max_rows)
+
+    def refresh_info_label(self, status=None):
+        text = f"Bin: {self.bin_size.get()} Holes | Material: {self.material.get()}"
+        self.info_label.config(text=f"{text} | {status}" if status else text)
+
+    def pdf_layout(self):
+        return sheet_layout(self.bolts, self.bin_size.get(), self.max_items, self.max_lengths, self.format_number)
 
     def save_pdf(self):
         """Save the layout as a PDF with a timestamped filename."""
@@ -349,64 +314,8 @@ class BoltBinApp:
         # Generate timestamped filename
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         file_path = os.path.join(self.pdf_dir, f"bolt_bin_{timestamp}.pdf")
-
-        c = canvas.Canvas(file_path, pagesize=letter)
-        c.setFont("Helvetica", 12)
-        c.drawString(100, 750, "Bolt Bin Layout - Active Bolt & Screw")
-        c.drawString(100, 730, f"Bin Size: {self.bin_size.get()} slots")
-        c.drawString(100, 710, f"Material: {self.material.get()}")
-
-        y = 690
-        for i, (size, lengths, items) in enumerate(self.bolts, 1):
-            size_str = self.format_number(size)
-            items_str = ", ".join(sorted([item for item in items if item != "Blank"] + ["Blank" for _ in items if item == "Blank"]))
-            lengths_str = ", ".join(self.format_number(l) for l in lengths)
-            contents = ", ".join(filter(None, [items_str, lengths_str]))
-            text = f"Row {i}: {size_str}\" ({contents})"
-            c.drawString(100, y, text)
-            y -= 20
-            if y < 400:
-                c.showPage()
-                c.setFont("Helvetica", 12)
-                y = 750
-
-        c.drawString(100, y, "Bin Layout:")
-        y -= 20
-        bin_slots = int(self.bin_size.get())
-        rows = 7 if bin_slots == 56 else 9
-        cols = self.max_items + self.max_lengths
-        cell_width = 25
-        cell_height = 20
-        offset_x, offset_y = 100, y - 20
-        text_height = 5
-
-        for i in range(rows + 1):
-            y_pos = offset_y - i * cell_height
-            c.line(offset_x, y_pos, offset_x + cols * cell_width, y_pos)
-        for j in range(cols + 1):
-            x_pos = offset_x + j * cell_width
-            c.line(x_pos, offset_y, x_pos, offset_y - rows * cell_height)
-
-        c.setFont("Helvetica", 10)
-        for i, (size, _, _) in enumerate(self.bolts[:rows], 0):
-            size_str = self.format_number(size)
-            c.drawString(offset_x - 40, offset_y - i * cell_height - cell_height / 2 - text_height,
-                         f"{size_str}\"")
-        for i, (size, lengths, items) in enumerate(self.bolts[:rows], 0):
-            item_list = [item for item in ["Nut", "Flatwasher", "Lockwasher", "Locknut", "Blank"] if item in items]
-            for j, item in enumerate(item_list[:self.max_items]):
-                if item != "Blank":
-                    item_char = {"Nut": "N", "Flatwasher": "F", "Lockwasher": "L", "Locknut": "LN"}[item]
-                    c.drawCentredString(offset_x + j * cell_width + cell_width / 2,
-                                       offset_y - i * cell_height - cell_height / 2 - text_height, item_char)
-            start_col = len(item_list)
-            for j, length in enumerate(lengths[:self.max_lengths]):
-                length_str = self.format_number(length)
-                c.drawCentredString(offset_x + (j + start_col) * cell_width + cell_width / 2,
-                                   offset_y - i * cell_height - cell_height / 2 - text_height, length_str)
-
-        c.save()
-        messagebox.showinfo("Success", f"PDF saved to: {file_path}", parent=self.current_screen)
+        self.exporter.submit(bin_pdf.save, self.bin_size.get(), self.material.get(), self.pdf_layout(), file_path,
+                             done=lambda path: f"PDF saved to: {path}", failed="Failed to save PDF")
 
     def print_pdf(self):
         """Print the layout as a PDF."""
@@ -414,77 +323,11 @@ class BoltBinApp:
             messagebox.showerror("Error", "No bolts or items to print!", parent=self.current_screen)
             return
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-            file_path = tmp_file.name
-            c = canvas.Canvas(file_path, pagesize=letter)
-            c.setFont("Helvetica", 12)
-            c.drawString(100, 750, "Bolt Bin Layout - Active Bolt & Screw")
-            c.drawString(100, 730, f"Bin Size: {self.bin_size.get()} slots")
-            c.drawString(100, 710, f"Material: {self.material.get()}")
-
-            y = 690
-            for i, (size, lengths, items) in enumerate(self.bolts, 1):
-                size_str = self.format_number(size)
-                items_str = ", ".join(sorted([item for item in items if item != "Blank"] + ["Blank" for _ in items if item == "Blank"]))
-                lengths_str = ", ".join(self.format_number(l) for l in lengths)
-                contents = ", ".join(filter(None, [items_str, lengths_str]))
-                text = f"Row {i}: {size_str}\" ({contents})"
-                c.drawString(100, y, text)
-                y -= 20
-                if y < 400:
-                    c.showPage()
-                    c.setFont("Helvetica", 12)
-                    y = 690
-
-            c.drawString(100, y, "Bin Layout:")
-            y -= 20
-            bin_slots = int(self.bin_size.get())
-            rows = 7 if bin_slots == 56 else 9
-            cols = self.max_items + self.max_lengths
-            cell_width = 25
-            cell_height = 20
-            offset_x, offset_y = 100, y - 20
-            text_height = 5
-
-            for i in range(rows + 1):
-                y_pos = offset_y - i * cell_height
-                c.line(offset_x, y_pos, offset_x + cols * cell_width, y_pos)
-            for j in range(cols + 1):
-                x_pos = offset_x + j * cell_width
-                c.line(x_pos, offset_y, x_pos, offset_y - rows * cell_height)
-
-            c.setFont("Helvetica", 10)
-            for i, (size, _, _) in enumerate(self.bolts[:rows], 0):
-                size_str = self.format_number(size)
-                c.drawString(offset_x - 40, offset_y - i * cell_height - cell_height / 2 - text_height,
-                             f"{size_str}\"")
-            for i, (size, lengths, items) in enumerate(self.bolts[:rows], 0):
-                item_list = [item for item in ["Nut", "Flatwasher", "Lockwasher", "Locknut", "Blank"] if item in items]
-                for j, item in enumerate(item_list[:self.max_items]):
-                    if item != "Blank":
-                        item_char = {"Nut": "N", "Flatwasher": "F", "Lockwasher": "L", "Locknut": "LN"}[item]
-                        c.drawCentredString(offset_x + j * cell_width + cell_width / 2,
-                                           offset_y - i * cell_height - cell_height / 2 - text_height, item_char)
-                start_col = len(item_list)
-                for j, length in enumerate(lengths[:self.max_lengths]):
-                    length_str = self.format_number(length)
-                    c.drawCentredString(offset_x + (j + start_col) * cell_width + cell_width / 2,
-                                       offset_y - i * cell_height - cell_height / 2 - text_height, length_str)
-
-            c.save()
-
-        try:
-            subprocess.run(["lp", file_path], check=True)
-            messagebox.showinfo("Success", "PDF sent to printer.", parent=self.current_screen)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to print PDF: {str(e)}", parent=self.current_screen)
-        finally:
-            try:
-                os.unlink(file_path)
-            except Exception:
-                pass
+        self.exporter.submit(bin_pdf.send_to_printer, self.bin_size.get(), self.material.get(), self.pdf_layout(),
+                             done=lambda result: "PDF sent to printer.", failed="Failed to print PDF")
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = BoltBinApp(root)
     root.mainloop()
+    app.exporter.close()